@@ -0,0 +1,34 @@
+"""add asset loans overdue index
+
+Revision ID: 3b7e0c5a9f12
+Revises: 9d4b2e7f1a60
+Create Date: 2026-10-17 16:08:41.927315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e0c5a9f12'
+down_revision: Union[str, Sequence[str], None] = '9d4b2e7f1a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_asset_loans_due_date_borrowed', 'asset_loans', ['due_date'], unique=False,
+        postgresql_where=sa.text("loan_status = 'borrowed'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_asset_loans_due_date_borrowed', table_name='asset_loans',
+        postgresql_where=sa.text("loan_status = 'borrowed'"),
+    )
@@ -0,0 +1,28 @@
+"""add assets keyset index
+
+Revision ID: 8a3f51c0d2e4
+Revises: 4c1d7e9a2b6f
+Create Date: 2026-10-17 11:02:17.551093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a3f51c0d2e4'
+down_revision: Union[str, Sequence[str], None] = '4c1d7e9a2b6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_assets_created_at_id', 'assets', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_assets_created_at_id', table_name='assets')
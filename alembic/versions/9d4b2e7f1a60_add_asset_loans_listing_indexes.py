@@ -0,0 +1,41 @@
+"""add asset loans listing indexes
+
+Revision ID: 9d4b2e7f1a60
+Revises: f3a9c6d18e57
+Create Date: 2026-10-17 15:24:08.310472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4b2e7f1a60'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c6d18e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_asset_loans_created_at_id', 'asset_loans',
+        [sa.text('created_at DESC'), sa.text('id DESC')], unique=False,
+    )
+    op.create_index(
+        'ix_asset_loans_user_id_created_at', 'asset_loans',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False,
+    )
+    op.create_index(
+        'ix_asset_loans_loan_status_created_at', 'asset_loans',
+        ['loan_status', sa.text('created_at DESC'), sa.text('id DESC')], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_asset_loans_loan_status_created_at', table_name='asset_loans')
+    op.drop_index('ix_asset_loans_user_id_created_at', table_name='asset_loans')
+    op.drop_index('ix_asset_loans_created_at_id', table_name='asset_loans')
@@ -0,0 +1,34 @@
+"""add asset loans active unique index
+
+Revision ID: c41f8a2d6e93
+Revises: 3b7e0c5a9f12
+Create Date: 2026-10-17 17:12:55.604218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f8a2d6e93'
+down_revision: Union[str, Sequence[str], None] = '3b7e0c5a9f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'uq_asset_loans_active_asset_id', 'asset_loans', ['asset_id'], unique=True,
+        postgresql_where=sa.text("loan_status IN ('borrowed', 'overdue')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'uq_asset_loans_active_asset_id', table_name='asset_loans',
+        postgresql_where=sa.text("loan_status IN ('borrowed', 'overdue')"),
+    )
@@ -0,0 +1,47 @@
+"""add trigram search indexes
+
+Revision ID: c7e2a94f1b03
+Revises: 8a3f51c0d2e4
+Create Date: 2026-10-17 12:40:05.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a94f1b03'
+down_revision: Union[str, Sequence[str], None] = '8a3f51c0d2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRGM_INDEXES = [
+    ('ix_assets_name_trgm', 'assets', 'name'),
+    ('ix_assets_asset_code_trgm', 'assets', 'asset_code'),
+    ('ix_assets_serial_number_trgm', 'assets', 'serial_number'),
+    ('ix_users_username_trgm', 'users', 'username'),
+    ('ix_users_email_trgm', 'users', 'email'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(TRGM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,48 @@
+"""add assets search vector
+
+Revision ID: e5b81d3c7a29
+Revises: c7e2a94f1b03
+Create Date: 2026-10-17 14:15:48.902317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b81d3c7a29'
+down_revision: Union[str, Sequence[str], None] = 'c7e2a94f1b03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Kept literal so the migration does not change if the model expression does.
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(asset_code, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(serial_number, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'assets',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_assets_search_vector', 'assets', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_assets_search_vector', table_name='assets')
+    op.drop_column('assets', 'search_vector')
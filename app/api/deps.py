@@ -1,12 +1,17 @@
 import uuid
-from fastapi import Depends
+from fastapi import Depends, Request
+from starlette.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session, joinedload
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.core.auth_cache import Principal, principal_cache
+from app.core.rate_limit import limiter
+from app.db.lazy import LazyAsyncSession, LazySession, track_request_session
+from app.db.session import AsyncReadSessionLocal, ReadSessionLocal, SessionLocal
 from app.models.user import User
-from app.utils.exceptions import InvalidCredentialsException, NotFoundException
+from app.utils.audit import get_client_ip
+from app.utils.exceptions import InvalidCredentialsException, NotFoundException, TooManyRequestsException
 from app.core.permissions import (
     Permission,
     RolePermission,
@@ -23,17 +28,56 @@ security = HTTPBearer(
 def get_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     return credentials.credentials
 
-def get_db():
-    db = SessionLocal()
+def get_db(request: Request):
+    db = LazySession(SessionLocal)
+    track_request_session(request.scope.setdefault("state", {}), db)
     try:
         yield db
     finally:
         db.close()
 
+def get_read_db(request: Request):
+    """Session for read-only routes: reads go to a replica, writes stay on the primary"""
+    db = LazySession(ReadSessionLocal)
+    track_request_session(request.scope.setdefault("state", {}), db)
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(request: Request):
+    db = LazyAsyncSession(AsyncReadSessionLocal)
+    track_request_session(request.scope.setdefault("state", {}), db)
+    try:
+        yield db
+    finally:
+        await db.close()
+
+def get_claims_principal(db: Session, user_id: uuid.UUID, payload: dict) -> Principal:
+    """Build a principal from role/permission claims, checking only the token version"""
+    current = principal_cache.get_token_version(user_id)
+    if current is None:
+        row = db.query(User.token_version, User.is_active).filter(User.id == user_id).first()
+        if not row:
+            raise NotFoundException("User")
+        current = (row.token_version, row.is_active)
+        principal_cache.set_token_version(user_id, *current)
+
+    token_version, is_active = current
+    if payload["ver"] != token_version:
+        raise InvalidCredentialsException("Token has been revoked")
+
+    return Principal.from_claims(user_id, payload, is_active=is_active)
+
+
 def get_current_user(
     token: str = Depends(get_token),
     db: Session = Depends(get_db),
-):
+) -> Principal:
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -51,33 +95,39 @@ def get_current_user(
     except (ValueError, TypeError):
         raise InvalidCredentialsException("Invalid user ID format")
 
-    
-    user = db.query(User).options(joinedload(User.role)).filter(User.id == user_uuid).first()
+    if "ver" in payload:
+        principal = get_claims_principal(db, user_uuid, payload)
+    else:
+        user = db.query(User).options(joinedload(User.role)).filter(User.id == user_uuid).first()
+
+        if not user:
+            raise NotFoundException("User")
+
+        principal = Principal.from_user(user)
 
-    if not user:
-        raise NotFoundException("User")
+    principal_cache.set(token, principal, token_exp=payload.get("exp"))
 
-    return user
+    return principal
 
 
 def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if not current_user.is_active:
         raise InvalidCredentialsException("User account is inactive")
     return current_user
 
 
 def get_super_admin(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+    current_user: Principal = Depends(get_current_active_user),
+) -> Principal:
     return require_super_admin(current_user)
 
 
 def require_permission_dependency(permission: Permission):
     def permission_checker(
-        current_user: User = Depends(get_current_active_user),
-    ) -> User:
+        current_user: Principal = Depends(get_current_active_user),
+    ) -> Principal:
         if not RolePermission.has_permission(current_user, permission):
             raise PermissionDeniedException(
                 f"You don't have permission to {permission.value}"
@@ -85,3 +135,30 @@ def require_permission_dependency(permission: Permission):
         return current_user
     
     return permission_checker
+
+
+async def _enforce_rate_limit(scope: str, identity: str, limit: str) -> None:
+    if limiter.backend.blocking:
+        retry_after = await run_in_threadpool(limiter.check, scope, identity, limit)
+    else:
+        retry_after = limiter.check(scope, identity, limit)
+
+    if retry_after is not None:
+        raise TooManyRequestsException(
+            "Rate limit exceeded, please retry later",
+            retry_after=max(1, int(retry_after + 0.999)),
+        )
+
+
+def rate_limit(scope: str, limit: str, key: str = "user"):
+    """Route dependency enforcing ``limit`` (e.g. ``"60/minute"``) per user or per client IP"""
+    if key == "ip":
+        async def ip_rate_limiter(request: Request) -> None:
+            await _enforce_rate_limit(scope, get_client_ip(request) or "unknown", limit)
+
+        return ip_rate_limiter
+
+    async def user_rate_limiter(current_user: Principal = Depends(get_current_user)) -> None:
+        await _enforce_rate_limit(scope, str(current_user.id), limit)
+
+    return user_rate_limiter
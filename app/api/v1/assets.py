@@ -1,20 +1,42 @@
-from fastapi import APIRouter, Depends, status, Request, Query
+from fastapi import APIRouter, Depends, File, status, Request, Response, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Literal, Optional
 import uuid
 
-from app.api.deps import get_db, get_current_active_user, require_permission_dependency
+from app.api.deps import get_db, get_read_db, get_current_active_user, require_permission_dependency, rate_limit
+from app.core.config import settings
 from app.core.permissions import Permission
+from app.core.suggest_index import SUGGEST_FIELDS
+from app.db.session import ReadSessionLocal
 from app.models.user import User
-from app.schemas.asset import AssetCreate, AssetUpdate, AssetResponse
+from app.schemas.asset import (
+    AssetBulkUpdate,
+    AssetCategorySummary,
+    AssetCreate,
+    AssetUpdate,
+    AssetResponse,
+    AssetSearchHighlight,
+    AssetSearchResult,
+)
 from app.schemas.auth import BaseResponse
+from app.schemas.user import UserSummary
+from app.services.asset_export_service import EXPORT_MEDIA_TYPES, AssetExportService
+from app.services.asset_import_service import AssetImportService
 from app.services.asset_service import AssetService
 from app.utils.audit import log_asset_action, get_client_ip
-from app.utils.response import success_response
+from app.utils.etag import cache_headers, etag_matches, make_etag, not_modified, set_cache_headers
+from app.utils.fieldsets import parse_expand, parse_fields, project_many
+from app.utils.response import fast_success_response, success_response
 from app.utils.exceptions import NotFoundException
 
 router = APIRouter(prefix="/assets", tags=["Assets"])
 
+ASSET_EXPANSIONS = {
+    "category": AssetCategorySummary,
+    "pic_user": UserSummary,
+}
+
 
 @router.post("/create_asset", status_code=status.HTTP_201_CREATED)
 def create_asset(
@@ -40,38 +62,143 @@ def create_asset(
     )
 
 
-@router.get("/list_assets", status_code=status.HTTP_200_OK)
+@router.post("/import", status_code=status.HTTP_200_OK)
+def import_assets(
+    request: Request,
+    file: UploadFile = File(..., description="CSV or XLSX file with a header row of AssetCreate fields"),
+    dry_run: bool = Query(False, description="Validate and report without inserting anything"),
+    current_user: User = Depends(require_permission_dependency(Permission.MANAGE_ASSETS)),
+    db: Session = Depends(get_db),
+):
+    file_format = AssetImportService.detect_format(file.filename)
+    report = AssetImportService.import_assets(
+        db,
+        file.file,
+        file_format,
+        current_user,
+        ip_address=get_client_ip(request),
+        dry_run=dry_run,
+    )
+
+    return success_response(
+        data=report,
+        message="Asset import validated" if dry_run else "Asset import finished",
+    )
+
+
+@router.get(
+    "/list_assets",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("assets:list", settings.RATE_LIMIT_ASSET_LIST))],
+)
 def get_assets(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; overrides skip"),
+    include_total: bool = Query(True, description="Set to false to skip the total count on deep pages"),
     status: Optional[str] = Query(None, description="Filter by asset status"),
     category_id: Optional[uuid.UUID] = Query(None, description="Filter by category ID"),
     search: Optional[str] = Query(None, description="Search by name, code, or serial number"),
+    search_mode: Literal["contains", "fuzzy"] = Query("contains", description="contains: substring match, fuzzy: trigram similarity"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,asset_code,name,current_status"),
+    expand: Optional[str] = Query(None, description="Comma-separated relations to embed: category, pic_user"),
     current_user: User = Depends(require_permission_dependency(Permission.VIEW_ASSETS)),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    assets = AssetService.get_assets(
+    selected_fields = parse_fields(fields, AssetResponse)
+    expand_relations = parse_expand(expand, ASSET_EXPANSIONS)
+
+    # Versions are read before the page, so a write racing this request can
+    # only make the ETag older than the data (a spurious refetch), never newer.
+    versions = sorted(AssetService.get_list_versions(db, expand_relations).items())
+    etag = make_etag("assets", versions, sorted(request.query_params.multi_items()))
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    expansions = {name: ASSET_EXPANSIONS[name] for name in expand_relations}
+    items, next_cursor = AssetService.get_assets_page_data(
         db=db,
-        skip=skip,
+        serialize=lambda assets: project_many(assets, AssetResponse, selected_fields, expansions),
         limit=limit,
+        cursor=cursor,
+        skip=skip,
         status=status,
         category_id=category_id,
         search=search,
+        search_mode=search_mode,
+        fields=selected_fields,
+        expand=expand_relations,
+        versions=versions,
     )
     
-    total = AssetService.count_assets(
+    if not items:
+        raise NotFoundException("Asset")
+    
+    total = None
+    if include_total:
+        total = AssetService.count_assets(
+            db=db,
+            status=status,
+            category_id=category_id,
+            search=search,
+            search_mode=search_mode,
+            versions=versions,
+        )
+    
+    return fast_success_response(
+        data={
+            "items": items,
+            "total": total,
+            "skip": skip if cursor is None else None,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        },
+        message="Assets retrieved successfully",
+        headers=cache_headers(etag),
+    )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("assets:search", settings.RATE_LIMIT_ASSET_LIST))],
+)
+def search_assets(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms; supports \"quoted phrases\", or, and -exclusion"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    include_total: bool = Query(True, description="Set to false to skip the total count"),
+    status: Optional[str] = Query(None, description="Filter by asset status"),
+    category_id: Optional[uuid.UUID] = Query(None, description="Filter by category ID"),
+    current_user: User = Depends(require_permission_dependency(Permission.VIEW_ASSETS)),
+    db: Session = Depends(get_read_db),
+):
+    results = AssetService.search_assets(
         db=db,
+        query=q,
+        skip=skip,
+        limit=limit,
         status=status,
         category_id=category_id,
-        search=search,
     )
-    
-    if not assets or total == 0:
-        raise NotFoundException("Asset")
-    
-    return success_response(
+
+    total = None
+    if include_total:
+        total = AssetService.count_search_assets(db=db, query=q, status=status, category_id=category_id)
+
+    items = [
+        AssetSearchResult(
+            **AssetResponse.model_validate(asset).model_dump(),
+            rank=rank,
+            highlight=AssetSearchHighlight(name=name_highlight or None, description=description_highlight or None),
+        )
+        for asset, rank, name_highlight, description_highlight in results
+    ]
+
+    return fast_success_response(
         data={
-            "items": [AssetResponse.model_validate(asset).model_dump() for asset in assets],
+            "items": items,
             "total": total,
             "skip": skip,
             "limit": limit,
@@ -80,16 +207,69 @@ def get_assets(
     )
 
 
+@router.get("/suggest", status_code=status.HTTP_200_OK)
+def suggest_assets(
+    prefix: str = Query(..., min_length=1, max_length=150, description="Leading characters of an asset code or serial number"),
+    field: Literal["all", "asset_code", "serial_number"] = Query("all", description="Which values to suggest"),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(require_permission_dependency(Permission.VIEW_ASSETS)),
+    db: Session = Depends(get_read_db),
+):
+    fields = SUGGEST_FIELDS if field == "all" else (field,)
+    suggestions = AssetService.suggest_assets(db=db, prefix=prefix, limit=limit, fields=fields)
+
+    return success_response(
+        data={"items": suggestions},
+        message="Suggestions retrieved successfully",
+    )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("assets:export", settings.RATE_LIMIT_ASSET_EXPORT))],
+)
+def export_assets(
+    format: Literal["csv", "xlsx", "ndjson"] = Query("csv", description="Export file format"),
+    status: Optional[str] = Query(None, description="Filter by asset status"),
+    category_id: Optional[uuid.UUID] = Query(None, description="Filter by category ID"),
+    search: Optional[str] = Query(None, description="Search by name, code, or serial number"),
+    search_mode: Literal["contains", "fuzzy"] = Query("contains", description="contains: substring match, fuzzy: trigram similarity"),
+    current_user: User = Depends(require_permission_dependency(Permission.VIEW_ASSETS)),
+):
+    body = AssetExportService.stream_assets(
+        ReadSessionLocal,
+        format,
+        status=status,
+        category_id=category_id,
+        search=search,
+        search_mode=search_mode,
+    )
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{AssetExportService.filename(format)}"'},
+    )
+
+
 @router.get("/{asset_id}/get_asset", status_code=status.HTTP_200_OK)
 def get_asset(
     asset_id: uuid.UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(require_permission_dependency(Permission.VIEW_ASSETS)),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    asset = AssetService.get_asset(db, asset_id)
-    
+    asset = AssetService.get_asset_data(db, asset_id)
+
+    etag = make_etag("asset", asset["id"], asset["updated_at"])
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    set_cache_headers(response, etag)
     return success_response(
-        data=AssetResponse.model_validate(asset).model_dump(),
+        data=asset,
         message="Asset retrieved successfully",
     )
 
@@ -119,6 +299,33 @@ def update_asset(
     )
 
 
+@router.patch("/bulk", status_code=status.HTTP_200_OK)
+def bulk_update_assets(
+    payload: AssetBulkUpdate,
+    request: Request,
+    current_user: User = Depends(require_permission_dependency(Permission.MANAGE_ASSETS)),
+    db: Session = Depends(get_db),
+):
+    updated_ids = AssetService.bulk_update_assets(
+        db,
+        payload.patch.model_dump(exclude_unset=True),
+        current_user,
+        asset_ids=payload.ids,
+        filters=payload.filter.model_dump() if payload.filter else None,
+        ip_address=get_client_ip(request),
+    )
+
+    data = {"updated": len(updated_ids), "ids": updated_ids}
+    if payload.ids is not None:
+        found = set(updated_ids)
+        data["not_found"] = [asset_id for asset_id in dict.fromkeys(payload.ids) if asset_id not in found]
+
+    return success_response(
+        data=data,
+        message="Assets updated successfully",
+    )
+
+
 @router.delete("/{asset_id}/delete_asset", status_code=status.HTTP_200_OK)
 def delete_asset(
     asset_id: uuid.UUID,
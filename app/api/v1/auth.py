@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
-from app.services.auth_service import authenticate_user, refresh_access_token
+from app.services.auth_service import authenticate_user_async, refresh_access_token
 from app.schemas.auth import (
     LoginRequest,
     TokenResponse,
@@ -10,21 +9,22 @@ from app.schemas.auth import (
     BaseResponse,
 )
 from app.schemas.user import UserResponse
-from app.api.deps import get_current_user
+from app.api.deps import get_db, get_current_user, rate_limit
+from app.core.config import settings
+from app.core.auth_cache import Principal
 from app.models.user import User
+from app.services.user_service import UserService
 
 router = APIRouter(tags=["Auth"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-@router.post("/login", response_model=TokenResponse, status_code=status.HTTP_200_OK)
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    tokens = authenticate_user(db, data.email, data.password)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("auth:login", settings.RATE_LIMIT_LOGIN, key="ip"))],
+)
+async def login(data: LoginRequest, db: Session = Depends(get_db)):
+    tokens = await authenticate_user_async(db, data.email, data.password)
     
     return TokenResponse(
         status=200,
@@ -51,18 +51,24 @@ def refresh_token(data: RefreshTokenRequest, db: Session = Depends(get_db)):
     )
 
 @router.get("/me", status_code=status.HTTP_200_OK)
-def get_current_user_profile(current_user: User = Depends(get_current_user)):
+def get_current_user_profile(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    # Principals resolved from token claims carry no profile fields
+    profile = current_user if current_user.username is not None else UserService.get_user(db, current_user.id)
+    
     return BaseResponse(
         status=200,
         message="User profile retrieved successfully",
         data=UserResponse(
-            id=current_user.id,
-            username=current_user.username,
-            email=current_user.email,
-            is_active=current_user.is_active,
-            role_id=current_user.role_id,
-            created_at=current_user.created_at,
-            updated_at=current_user.updated_at,
+            id=profile.id,
+            username=profile.username,
+            email=profile.email,
+            is_active=profile.is_active,
+            role_id=profile.role_id,
+            created_at=profile.created_at,
+            updated_at=profile.updated_at,
         ).model_dump()
     )
 
@@ -1,37 +1,51 @@
-from fastapi import APIRouter, Depends, status, Request
+from fastapi import APIRouter, Depends, status, Request, Query
 from sqlalchemy.orm import Session
+from datetime import datetime
 from typing import Optional
 import uuid
 
-from app.api.deps import get_db, get_current_active_user, require_permission_dependency
-from app.core.permissions import Permission, RolePermission
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_db, get_async_read_db, get_current_active_user, require_permission_dependency, rate_limit
+from app.core.config import settings
+from app.core.permissions import Permission, PermissionDeniedException, RolePermission
 from app.models.user import User
 from app.models.enums import LoanStatus
 from app.schemas.borrow import (
     LoanCreate,
     LoanUpdate,
     LoanStatusUpdate,
+    LoanBatchReview,
     LoanResponse,
     LoanWithAsset,
 )
+from app.schemas.asset import AssetSummary
 from app.schemas.auth import BaseResponse
+from app.schemas.user import UserSummary
 from app.services.borrow_service import (
     create_loan_request,
     approve_loan,
     reject_loan,
     start_borrowing,
     return_loan,
-    get_user_loans,
-    get_all_loans,
-    get_loan_by_id,
+    get_user_loans_async,
+    get_all_loans_async,
+    get_loan_by_id_async,
     check_overdue_loans,
+    batch_review_loans,
     LoanStatusTransitionError,
 )
 from app.utils.audit import log_loan_action, get_client_ip
 from app.utils.exceptions import ValidationException, NotFoundException
+from app.utils.fieldsets import parse_expand, parse_fields, project_many
+from app.utils.response import fast_success_response
 
 router = APIRouter(prefix="/loans", tags=["Loans"])
 
+LOAN_EXPANSIONS = {
+    "asset": AssetSummary,
+    "user": UserSummary,
+}
+
 
 def get_user_friendly_error_message(error: Exception) -> str:
     """Convert technical error messages to user-friendly messages"""
@@ -89,40 +103,72 @@ def create_loan(
 
 
 @router.get("", status_code=status.HTTP_200_OK)
-def list_loans(
+async def list_loans(
     status_filter: Optional[str] = None,
+    asset_id: Optional[uuid.UUID] = None,
+    user_id: Optional[uuid.UUID] = Query(None, description="Borrower filter, admins only"),
+    created_from: Optional[datetime] = Query(None, description="Only loans created at or after this time"),
+    created_to: Optional[datetime] = Query(None, description="Only loans created before this time"),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,loan_status,due_date"),
+    expand: Optional[str] = Query(None, description="Comma-separated relations to embed: asset, user"),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
+    selected_fields = parse_fields(fields, LoanResponse)
+    expand_relations = parse_expand(expand, LOAN_EXPANSIONS)
+
+    if created_from and created_to and created_from > created_to:
+        raise ValidationException("created_from must not be after created_to")
+
+    is_admin = RolePermission.has_permission(current_user, Permission.MANAGE_LOANS)
+    if not is_admin and user_id is not None and user_id != current_user.id:
+        raise PermissionDeniedException("You can only access your own loans")
+
+    filters = {
+        "status": status_filter,
+        "asset_id": asset_id,
+        "created_from": created_from,
+        "created_to": created_to,
+        "limit": limit,
+        "cursor": cursor,
+        "fields": selected_fields,
+        "expand": expand_relations,
+    }
+
     try:
-        is_admin = RolePermission.has_permission(current_user, Permission.MANAGE_LOANS)
-        
         if is_admin:
-            loans = get_all_loans(db, status=status_filter)
+            loans, next_cursor = await get_all_loans_async(db, user_id=user_id, **filters)
         else:
-            loans = get_user_loans(db, current_user.id, status=status_filter)
+            loans, next_cursor = await get_user_loans_async(db, current_user.id, **filters)
         
-        if not loans or len(loans) == 0:
+        if not loans and cursor is None:
             raise NotFoundException("Loan")
         
-        return BaseResponse(
-            status=200,
+        expansions = {name: LOAN_EXPANSIONS[name] for name in expand_relations}
+        return fast_success_response(
+            data={
+                "items": project_many(loans, LoanResponse, selected_fields, expansions),
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None,
+            },
             message="Loans retrieved successfully",
-            data=[LoanResponse.model_validate(loan).model_dump() for loan in loans]
         )
-    except NotFoundException:
+    except (NotFoundException, ValidationException):
         raise
     except Exception as e:
         raise ValidationException(get_user_friendly_error_message(e))
 
 
 @router.get("/{loan_id}", status_code=status.HTTP_200_OK)
-def get_loan(
+async def get_loan(
     loan_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    loan = get_loan_by_id(db, loan_id)
+    loan = await get_loan_by_id_async(db, loan_id)
     
     is_admin = RolePermission.has_permission(current_user, Permission.MANAGE_LOANS)
     if not is_admin and str(loan.user_id) != str(current_user.id):
@@ -274,7 +320,11 @@ def return_borrowed_asset(
         raise
 
 
-@router.post("/check-overdue", status_code=status.HTTP_200_OK)
+@router.post(
+    "/check-overdue",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("loans:check_overdue", settings.RATE_LIMIT_CHECK_OVERDUE))],
+)
 def check_overdue(
     current_user: User = Depends(require_permission_dependency(Permission.MANAGE_LOANS)),
     db: Session = Depends(get_db),
@@ -286,3 +336,28 @@ def check_overdue(
         message=f"Found {len(overdue_loans)} overdue loans",
         data=[LoanResponse.model_validate(loan).model_dump() for loan in overdue_loans]
     )
+
+
+@router.post("/batch", status_code=status.HTTP_200_OK)
+def batch_review_loan_requests(
+    payload: LoanBatchReview,
+    request: Request,
+    current_user: User = Depends(require_permission_dependency(Permission.MANAGE_LOANS)),
+    db: Session = Depends(get_db),
+):
+    """Approve or reject many loans at once; each item succeeds or fails on its own"""
+    results = batch_review_loans(
+        db,
+        [item.model_dump() for item in payload.items],
+        approver=current_user,
+        ip_address=get_client_ip(request),
+    )
+    for result in results:
+        if result["data"] is not None:
+            result["data"] = LoanResponse.model_validate(result["data"])
+
+    succeeded = sum(result["success"] for result in results)
+    return fast_success_response(
+        data={"succeeded": succeeded, "failed": len(results) - succeeded, "results": results},
+        message="Loan batch processed",
+    )
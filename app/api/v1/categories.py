@@ -0,0 +1,131 @@
+from fastapi import APIRouter, Depends, status, Request, Query
+from sqlalchemy.orm import Session
+import uuid
+
+from app.api.deps import get_db, get_read_db, require_permission_dependency
+from app.core.permissions import Permission
+from app.models.user import User
+from app.schemas.category import CategoryAssetCounts, CategoryCreate, CategoryUpdate, CategoryResponse
+from app.services.category_service import CategoryService
+from app.utils.audit import log_category_action, get_client_ip
+from app.utils.response import success_response
+from app.utils.exceptions import NotFoundException
+
+router = APIRouter(prefix="/categories", tags=["Categories"])
+
+
+@router.post("", status_code=status.HTTP_201_CREATED)
+def create_category(
+    category_data: CategoryCreate,
+    request: Request,
+    current_user: User = Depends(require_permission_dependency(Permission.MANAGE_CATEGORIES)),
+    db: Session = Depends(get_db),
+):
+    category = CategoryService.create_category(db, category_data.model_dump())
+
+    log_category_action(
+        db=db,
+        user=current_user,
+        action="create",
+        category_id=category.id,
+        ip_address=get_client_ip(request),
+    )
+
+    return success_response(
+        data=CategoryResponse.model_validate(category).model_dump(),
+        message="Category created successfully",
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+def get_categories(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    with_counts: bool = Query(False, description="Include per-category asset counts by status"),
+    current_user: User = Depends(require_permission_dependency(Permission.VIEW_CATEGORIES)),
+    db: Session = Depends(get_read_db),
+):
+    categories = CategoryService.get_categories(db=db, skip=skip, limit=limit)
+    total = CategoryService.count_categories(db=db)
+
+    if not categories or total == 0:
+        raise NotFoundException("Asset Category")
+
+    items = [CategoryResponse.model_validate(category).model_dump() for category in categories]
+
+    if with_counts:
+        counts = CategoryService.get_asset_counts(db, [category.id for category in categories])
+        for item in items:
+            item["asset_counts"] = counts.get(str(item["id"])) or CategoryAssetCounts().model_dump()
+
+    return success_response(
+        data={
+            "items": items,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+        },
+        message="Categories retrieved successfully",
+    )
+
+
+@router.get("/{category_id}", status_code=status.HTTP_200_OK)
+def get_category(
+    category_id: uuid.UUID,
+    current_user: User = Depends(require_permission_dependency(Permission.VIEW_CATEGORIES)),
+    db: Session = Depends(get_read_db),
+):
+    category = CategoryService.get_category(db, category_id)
+
+    return success_response(
+        data=CategoryResponse.model_validate(category).model_dump(),
+        message="Category retrieved successfully",
+    )
+
+
+@router.put("/{category_id}", status_code=status.HTTP_200_OK)
+def update_category(
+    category_id: uuid.UUID,
+    category_data: CategoryUpdate,
+    request: Request,
+    current_user: User = Depends(require_permission_dependency(Permission.MANAGE_CATEGORIES)),
+    db: Session = Depends(get_db),
+):
+    category = CategoryService.update_category(db, category_id, category_data.model_dump(exclude_unset=True))
+
+    log_category_action(
+        db=db,
+        user=current_user,
+        action="update",
+        category_id=category.id,
+        ip_address=get_client_ip(request),
+    )
+
+    return success_response(
+        data=CategoryResponse.model_validate(category).model_dump(),
+        message="Category updated successfully",
+    )
+
+
+@router.delete("/{category_id}", status_code=status.HTTP_200_OK)
+def delete_category(
+    category_id: uuid.UUID,
+    request: Request,
+    current_user: User = Depends(require_permission_dependency(Permission.MANAGE_CATEGORIES)),
+    db: Session = Depends(get_db),
+):
+    CategoryService.delete_category(db, category_id)
+
+    log_category_action(
+        db=db,
+        user=current_user,
+        action="delete",
+        category_id=category_id,
+        ip_address=get_client_ip(request),
+    )
+
+    return success_response(
+        data=None,
+        message="Category deleted successfully",
+    )
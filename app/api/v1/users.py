@@ -1,19 +1,25 @@
-from fastapi import APIRouter, Depends, status, Request, Query
+from fastapi import APIRouter, Depends, status, Request, Response, Query
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Literal, Optional
 import uuid
 
-from app.api.deps import get_db, get_current_active_user, get_super_admin
+from app.api.deps import get_db, get_read_db, get_current_active_user, get_super_admin
 from app.core.permissions import Permission, require_owner_or_admin, require_super_admin
 from app.models.user import User
-from app.schemas.user import UserCreate, UserUpdate, UserResponse
+from app.schemas.user import RoleSummary, UserCreate, UserUpdate, UserResponse
 from app.services.user_service import UserService
 from app.utils.audit import log_user_action, get_client_ip
-from app.utils.response import success_response
+from app.utils.etag import etag_matches, make_etag, not_modified, set_cache_headers
+from app.utils.fieldsets import parse_expand, parse_fields, project_many
+from app.utils.response import fast_success_response, success_response
 from app.utils.exceptions import NotFoundException
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+USER_EXPANSIONS = {
+    "role": RoleSummary,
+}
+
 
 @router.post("", status_code=status.HTTP_201_CREATED)
 def create_user(
@@ -47,9 +53,15 @@ def get_users(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     role_id: Optional[uuid.UUID] = Query(None, description="Filter by role ID"),
     search: Optional[str] = Query(None, description="Search by username or email"),
+    search_mode: Literal["contains", "fuzzy"] = Query("contains", description="contains: substring match, fuzzy: trigram similarity"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,username,email"),
+    expand: Optional[str] = Query(None, description="Comma-separated relations to embed: role"),
     current_user: User = Depends(get_super_admin),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
+    selected_fields = parse_fields(fields, UserResponse)
+    expand_relations = parse_expand(expand, USER_EXPANSIONS)
+
     users = UserService.get_users(
         db=db,
         skip=skip,
@@ -57,6 +69,9 @@ def get_users(
         is_active=is_active,
         role_id=role_id,
         search=search,
+        search_mode=search_mode,
+        fields=selected_fields,
+        expand=expand_relations,
     )
     
     total = UserService.count_users(
@@ -64,14 +79,20 @@ def get_users(
         is_active=is_active,
         role_id=role_id,
         search=search,
+        search_mode=search_mode,
     )
     
     if not users or total == 0:
         raise NotFoundException("User")
     
-    return success_response(
+    return fast_success_response(
         data={
-            "items": [UserResponse.model_validate(user).model_dump() for user in users],
+            "items": project_many(
+                users,
+                UserResponse,
+                selected_fields,
+                {name: USER_EXPANSIONS[name] for name in expand_relations},
+            ),
             "total": total,
             "skip": skip,
             "limit": limit,
@@ -83,13 +104,21 @@ def get_users(
 @router.get("/{user_id}", status_code=status.HTTP_200_OK)
 def get_user(
     user_id: uuid.UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
-    target_user = UserService.get_user(db, user_id)
+    etag = make_etag("user", user_id, UserService.get_user_version(db, user_id))
     
     require_owner_or_admin(current_user, str(user_id))
     
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    
+    target_user = UserService.get_user(db, user_id)
+    set_cache_headers(response, make_etag("user", target_user.id, target_user.updated_at))
+    
     return success_response(
         data=UserResponse.model_validate(target_user).model_dump(),
         message="User retrieved successfully",
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from typing import Any, Callable, Optional
+
+from pydantic_core import to_jsonable_python
+
+from app.core.config import settings
+from app.core.metrics import ASSET_CACHE_EVICTIONS, ASSET_CACHE_INVALIDATIONS, ASSET_CACHE_REQUESTS
+from app.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# KEYS[1] = generation key, ARGV[1] = key template ("{gen}" is replaced by the generation)
+GET_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+local key = (string.gsub(ARGV[1], '{gen}', generation))
+return {generation, redis.call('GET', key)}
+"""
+
+# ARGV[2] = generation observed before loading; stale loads are dropped
+SET_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+if generation ~= ARGV[2] then
+    return 0
+end
+local key = (string.gsub(ARGV[1], '{gen}', generation))
+redis.call('SET', key, ARGV[3], 'PX', ARGV[4])
+return 1
+"""
+
+class AssetCache:
+    """Read-through cache for serialized asset reads.
+
+    Entries are keyed by their normalized parameters, including the table
+    versions they were read at, plus a generation counter that every asset
+    write bumps, so no stale entry is ever looked up again. A load that
+    started before a write is not stored after it, and a load from a
+    lagging replica is stored under the version that replica saw.
+
+    The in-process tier is short-lived because it only sees this worker's
+    invalidations; with ``redis_url`` a shared tier sits behind it and
+    honours invalidations from every worker. Redis errors fail open.
+    Values are returned in JSON form (UUIDs and datetimes as strings), are
+    shared between requests and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        maxsize: int = 10000,
+        ttl: float = 5,
+        redis_url: Optional[str] = None,
+        redis_ttl: float = 60,
+        prefix: str = "assetcache:",
+    ):
+        self.enabled = enabled
+        self.redis_ttl = redis_ttl
+        self.prefix = prefix
+        self._local = LRUCache(maxsize=maxsize, ttl=ttl, on_evict=ASSET_CACHE_EVICTIONS.inc)
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._redis = None
+
+        if redis_url:
+            import redis
+
+            self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.05, socket_connect_timeout=0.5)
+            self._get_script = self._redis.register_script(GET_SCRIPT)
+            self._set_script = self._redis.register_script(SET_SCRIPT)
+
+    @staticmethod
+    def params_key(params: dict) -> str:
+        normalized = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    def get_item(self, asset_id: uuid.UUID, versions: list, loader: Callable[[], Any]) -> Any:
+        return self._get_or_load(f"item:{asset_id}:{self.params_key(versions)}", loader)
+
+    def get_list(self, name: str, params: dict, loader: Callable[[], Any]) -> Any:
+        return self._get_or_load(f"list:{name}:{self.params_key(params)}", loader)
+
+    def invalidate(self) -> None:
+        """Drop every cached asset, list and count by bumping the generation"""
+        if not self.enabled:
+            return
+
+        ASSET_CACHE_INVALIDATIONS.inc()
+        with self._lock:
+            self._generation += 1
+
+        if self._redis is not None:
+            try:
+                self._redis.incr(self._generation_key)
+            except Exception as exc:
+                logger.warning(f"Asset cache invalidation could not reach Redis: {exc}")
+
+    def clear(self) -> None:
+        self.invalidate()
+        self._local.clear()
+
+    def stats(self) -> dict:
+        return self._local.stats()
+
+    @property
+    def _generation_key(self) -> str:
+        return f"{self.prefix}generation"
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.prefix}{{gen}}:{key}"
+
+    def _get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return to_jsonable_python(loader())
+
+        generation = self._generation
+        local_key = (generation, key)
+
+        value = self._local.get(local_key, _MISSING)
+        if value is not _MISSING:
+            ASSET_CACHE_REQUESTS.labels("memory", "hit").inc()
+            return value
+        ASSET_CACHE_REQUESTS.labels("memory", "miss").inc()
+
+        redis_generation = None
+        if self._redis is not None:
+            redis_generation, value = self._redis_get(key)
+            if value is not _MISSING:
+                ASSET_CACHE_REQUESTS.labels("redis", "hit").inc()
+                self._store_local(local_key, value, generation)
+                return value
+            ASSET_CACHE_REQUESTS.labels("redis", "miss").inc()
+
+        value = to_jsonable_python(loader())
+        self._store_local(local_key, value, generation)
+        if redis_generation is not None:
+            self._redis_set(key, value, redis_generation)
+        return value
+
+    def _store_local(self, local_key: tuple, value: Any, generation: int) -> None:
+        with self._lock:
+            if self._generation == generation:
+                self._local.set(local_key, value)
+
+    def _redis_get(self, key: str) -> tuple[Optional[bytes], Any]:
+        try:
+            result = self._get_script(keys=[self._generation_key], args=[self._redis_key(key)])
+        except Exception as exc:
+            logger.warning(f"Asset cache Redis tier unavailable: {exc}")
+            return None, _MISSING
+
+        generation = result[0]
+        if len(result) < 2 or result[1] is None:
+            return generation, _MISSING
+        return generation, json.loads(result[1])
+
+    def _redis_set(self, key: str, value: Any, generation: bytes) -> None:
+        try:
+            self._set_script(
+                keys=[self._generation_key],
+                args=[self._redis_key(key), generation, json.dumps(value), int(self.redis_ttl * 1000)],
+            )
+        except Exception as exc:
+            logger.warning(f"Asset cache Redis tier unavailable: {exc}")
+
+
+def create_asset_cache() -> AssetCache:
+    if settings.ASSET_CACHE_BACKEND not in ("memory", "redis"):
+        raise ValueError(f"Unknown asset cache backend: {settings.ASSET_CACHE_BACKEND}")
+
+    return AssetCache(
+        enabled=settings.ASSET_CACHE_ENABLED,
+        maxsize=settings.ASSET_CACHE_MAX_ENTRIES,
+        ttl=settings.ASSET_CACHE_TTL_SECONDS,
+        redis_url=settings.REDIS_URL if settings.ASSET_CACHE_BACKEND == "redis" else None,
+        redis_ttl=settings.ASSET_CACHE_REDIS_TTL_SECONDS,
+    )
+
+
+asset_cache = create_asset_cache()
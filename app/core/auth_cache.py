@@ -0,0 +1,147 @@
+import hashlib
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.core.config import settings
+from app.core.permissions import RolePermission
+from app.models.user import User
+from app.utils.cache import LRUCache
+
+
+@dataclass(frozen=True)
+class PrincipalRole:
+    id: Optional[uuid.UUID]
+    name: str
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Detached snapshot of the authenticated user.
+
+    Exposes the same attributes routes read from ``User`` (``id``, ``role.name``,
+    ``is_active``, ...) but is not bound to any session, so it can be shared
+    across requests without lazy loads or expiry on commit. Principals built
+    from token claims carry no profile fields (``username``, ``email``, ...).
+    """
+
+    id: uuid.UUID
+    role: Optional[PrincipalRole]
+    is_active: bool
+    token_version: int
+    permission_mask: int
+    role_id: Optional[uuid.UUID] = None
+    username: Optional[str] = None
+    email: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        role = PrincipalRole(id=user.role.id, name=user.role.name) if user.role else None
+        return cls(
+            id=user.id,
+            role=role,
+            is_active=user.is_active,
+            token_version=user.token_version,
+            permission_mask=RolePermission.get_permission_mask(role.name) if role else 0,
+            role_id=user.role_id,
+            username=user.username,
+            email=user.email,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    @classmethod
+    def from_claims(cls, user_id: uuid.UUID, payload: dict, is_active: bool) -> "Principal":
+        role_name = payload.get("role")
+        return cls(
+            id=user_id,
+            role=PrincipalRole(id=None, name=role_name) if role_name else None,
+            is_active=is_active,
+            token_version=payload["ver"],
+            permission_mask=payload.get("perms", 0),
+        )
+
+
+def build_access_claims(user: User) -> dict:
+    """Claims embedded in access tokens when ``ACCESS_TOKEN_EMBED_CLAIMS`` is on"""
+    role_name = user.role.name if user.role else None
+    return {
+        "role": role_name,
+        "perms": RolePermission.get_permission_mask(role_name) if role_name else 0,
+        "ver": user.token_version,
+    }
+
+
+class PrincipalCache:
+    """Per-process cache of authenticated principals keyed by token hash.
+
+    Entries never outlive the token they were resolved from. A secondary
+    index from user id to token hashes allows dropping every cached token of
+    a user when that user changes. The current ``token_version`` of each
+    user is cached separately so claim-carrying tokens can be checked for
+    revocation without loading the user row.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, version_ttl: float):
+        self.ttl = ttl
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._versions = LRUCache(maxsize=maxsize, ttl=version_ttl)
+        self._tokens_by_user: dict[uuid.UUID, set[str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Principal]:
+        if self.ttl <= 0:
+            return None
+        return self._cache.get(self.token_key(token))
+
+    def set(self, token: str, principal: Principal, token_exp: Optional[float] = None) -> None:
+        if self.ttl <= 0:
+            return
+
+        ttl = self.ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+            if ttl <= 0:
+                return
+
+        key = self.token_key(token)
+        self._cache.set(key, principal, ttl=ttl)
+        with self._lock:
+            keys = {k for k in self._tokens_by_user.get(principal.id, ()) if k in self._cache}
+            keys.add(key)
+            self._tokens_by_user[principal.id] = keys
+
+    def get_token_version(self, user_id: uuid.UUID) -> Optional[tuple[int, bool]]:
+        return self._versions.get(user_id)
+
+    def set_token_version(self, user_id: uuid.UUID, token_version: int, is_active: bool) -> None:
+        self._versions.set(user_id, (token_version, is_active))
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            keys = self._tokens_by_user.pop(user_id, set())
+        for key in keys:
+            self._cache.delete(key)
+        self._versions.delete(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens_by_user.clear()
+        self._cache.clear()
+        self._versions.clear()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    version_ttl=settings.TOKEN_VERSION_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,51 @@
+import threading
+import time
+import uuid
+from typing import Callable, Iterable, Optional
+
+from app.core.config import settings
+
+
+class CategoryCache:
+    """Per-process snapshot of every asset category as ``{id: name}``.
+
+    Categories are few and rarely change, so the whole table is loaded at
+    once and asset writes validate ``category_id`` against memory instead
+    of querying. Local category writes drop the snapshot immediately;
+    writes from other workers show up after ``ttl`` seconds, and ids
+    missing from the snapshot are always confirmed by the caller against
+    the database before being rejected.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._categories: Optional[dict[uuid.UUID, str]] = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get_all(self, loader: Callable[[], Iterable[tuple[uuid.UUID, str]]]) -> dict[uuid.UUID, str]:
+        categories = self._categories
+        if categories is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return categories
+
+        generation = self._generation
+        categories = dict(loader())
+        with self._lock:
+            # A category write during the load may be missing from it
+            if self.enabled and self._generation == generation:
+                self._categories = categories
+                self._loaded_at = time.monotonic()
+        return categories
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._categories = None
+
+
+category_cache = CategoryCache(ttl=settings.CATEGORY_CACHE_TTL_SECONDS)
@@ -1,12 +1,82 @@
+from ipaddress import IPv4Network, IPv6Network, ip_network
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    # always: ping on every checkout, idle: only after DB_POOL_PRE_PING_IDLE_SECONDS idle, never
+    DB_POOL_PRE_PING: str = "idle"
+    DB_POOL_PRE_PING_IDLE_SECONDS: int = 60
+
+    # Comma-separated read replica URLs; empty means all reads go to DATABASE_URL
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_RETRY_SECONDS: int = 30
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    AUTH_CACHE_TTL_SECONDS: int = 30
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+    ACCESS_TOKEN_EMBED_CLAIMS: bool = False
+    TOKEN_VERSION_CACHE_TTL_SECONDS: int = 30
+
+    PASSWORD_HASH_BACKEND: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 16
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10.0
+
+    # /metrics is only served when enabled; with a token, scrapers must send it as a Bearer token
+    METRICS_ENABLED: bool = False
+    METRICS_TOKEN: str = ""
+
+    # Comma-separated proxy IPs/CIDRs whose X-Forwarded-For / X-Real-IP headers are trusted
+    TRUSTED_PROXIES: str = ""
+
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_LOGIN: str = "20/minute"
+    RATE_LIMIT_ASSET_LIST: str = "120/minute"
+    RATE_LIMIT_ASSET_EXPORT: str = "6/minute"
+    RATE_LIMIT_CHECK_OVERDUE: str = "6/minute"
+
+    ASSET_CACHE_ENABLED: bool = True
+    ASSET_CACHE_BACKEND: str = "memory"
+    ASSET_CACHE_MAX_ENTRIES: int = 10000
+    ASSET_CACHE_TTL_SECONDS: int = 5
+    ASSET_CACHE_REDIS_TTL_SECONDS: int = 60
+
+    CATEGORY_CACHE_TTL_SECONDS: int = 60
+
+    ASSET_SUGGEST_ENABLED: bool = True
+    ASSET_SUGGEST_MAX_ENTRIES: int = 2500000
+    ASSET_SUGGEST_REFRESH_SECONDS: int = 300
+
+    ASSET_IMPORT_BATCH_SIZE: int = 1000
+    ASSET_IMPORT_MAX_ROWS: int = 200000
+    ASSET_IMPORT_MAX_ERRORS: int = 1000
+
+    LOAN_OVERDUE_SWEEP_ENABLED: bool = True
+    LOAN_OVERDUE_SWEEP_INTERVAL_SECONDS: int = 60
+    LOAN_OVERDUE_BATCH_SIZE: int = 1000
+
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+    @property
+    def trusted_proxy_networks(self) -> list[IPv4Network | IPv6Network]:
+        return [ip_network(value.strip(), strict=False) for value in self.TRUSTED_PROXIES.split(",") if value.strip()]
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+
+from app.core import security
+from app.core.config import settings
+from app.utils.exceptions import ServiceUnavailableException, TooManyRequestsException
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashExecutor:
+    """Bounded executor for bcrypt work with admission control.
+
+    At most ``max_workers`` hashes run at once and at most ``max_queue``
+    more wait behind them. Anything beyond that is rejected immediately
+    with 429 instead of tying up a request thread.
+    """
+
+    def __init__(
+        self,
+        backend: str = "thread",
+        max_workers: int = 4,
+        max_queue: int = 16,
+        timeout: float = 10.0,
+    ):
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash backend: {backend}")
+
+        self.backend = backend
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.backend == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix="password-hash",
+                        )
+        return self._executor
+
+    def _admit(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            raise TooManyRequestsException("Too many concurrent password operations, please retry shortly")
+
+    def _submit(self, fn: Callable, *args: Any):
+        self._admit()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            logger.exception("Password hash executor rejected work")
+            raise ServiceUnavailableException()
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn: Callable, *args: Any) -> Any:
+        future = self._submit(fn, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise ServiceUnavailableException("Password hashing timed out")
+
+    async def run_async(self, fn: Callable, *args: Any) -> Any:
+        future = self._submit(fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise ServiceUnavailableException("Password hashing timed out")
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self.run(security.verify_password, plain_password, hashed_password)
+
+    def hash(self, password: str) -> str:
+        return self.run(security.hash_password, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run_async(security.verify_password, plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self.run_async(security.hash_password, password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHashExecutor(
+    backend=settings.PASSWORD_HASH_BACKEND,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
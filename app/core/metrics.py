@@ -0,0 +1,46 @@
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured number of persistent connections", ["pool"]
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", ["pool"]
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond pool_size (negative while the pool is warming up)", ["pool"]
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["pool"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CONNECTION_HOLD = Histogram(
+    "db_pool_connection_hold_seconds",
+    "Time a connection stays checked out before it is returned",
+    ["pool"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after pool_timeout", ["pool"]
+)
+DB_POOL_PINGS = Counter(
+    "db_pool_pre_pings_total", "Liveness pings issued on checkout", ["pool", "result"]
+)
+
+ASSET_CACHE_REQUESTS = Counter(
+    "asset_cache_requests_total", "Asset cache lookups by tier and outcome", ["tier", "result"]
+)
+ASSET_CACHE_EVICTIONS = Counter(
+    "asset_cache_evictions_total", "Entries dropped from the in-process asset cache to stay within its size limit"
+)
+ASSET_CACHE_INVALIDATIONS = Counter(
+    "asset_cache_invalidations_total", "Asset cache invalidations triggered by writes"
+)
+
+
+def metrics_response() -> Response:
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
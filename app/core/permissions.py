@@ -26,6 +26,11 @@ class Permission(Enum):
     VIEW_AUDIT_LOGS = "view_audit_logs"
 
 
+# Stable bit per permission for the compact ``perms`` token claim.
+# Append new permissions at the end of the enum so existing bits keep their meaning.
+PERMISSION_BITS = {permission: 1 << index for index, permission in enumerate(Permission)}
+
+
 class RolePermission:
     
     SUPER_ADMIN_PERMISSIONS = [
@@ -63,8 +68,19 @@ class RolePermission:
         else:
             return []
     
+    @classmethod
+    def get_permission_mask(cls, role_name: str) -> int:
+        mask = 0
+        for permission in cls.get_permissions_for_role(role_name):
+            mask |= PERMISSION_BITS[permission]
+        return mask
+    
     @classmethod
     def has_permission(cls, user: User, permission: Permission) -> bool:
+        permission_mask = getattr(user, "permission_mask", None)
+        if permission_mask is not None:
+            return bool(permission_mask & PERMISSION_BITS[permission])
+        
         if not user.role:
             return False
         
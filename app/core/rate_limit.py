@@ -0,0 +1,169 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PERIOD_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Token bucket refilled at ``rate`` tokens per second, holding ``capacity`` tokens"""
+
+    rate: float
+    capacity: int
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimitRule":
+        """Parse ``"<count>/<second|minute|hour|day>"``, e.g. ``"60/minute"``"""
+        try:
+            count, period = value.strip().split("/")
+            count = int(count)
+            seconds = PERIOD_SECONDS[period.strip().lower()]
+        except (ValueError, KeyError):
+            raise ValueError(f"Invalid rate limit rule: {value!r}")
+
+        if count <= 0:
+            raise ValueError(f"Invalid rate limit rule: {value!r}")
+
+        return cls(rate=count / seconds, capacity=count)
+
+
+class InMemoryRateLimitBackend:
+    """Token buckets held in process memory, for single-worker deployments"""
+
+    blocking = False
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        # key -> [tokens, last refill timestamp, seconds to refill completely], least recently used first
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rule: RateLimitRule) -> float:
+        """Consume one token; return 0 when allowed, otherwise seconds until retry"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._prune(now)
+                bucket = self._buckets[key] = [float(rule.capacity), now, rule.capacity / rule.rate]
+            else:
+                self._buckets.move_to_end(key)
+
+            tokens = min(rule.capacity, bucket[0] + (now - bucket[1]) * rule.rate)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return 0.0
+
+            bucket[0] = tokens
+            return (1 - tokens) / rule.rate
+
+    def _prune(self, now: float) -> None:
+        # Walk from the least recently used end: buckets idle long enough to
+        # refill completely carry no state worth keeping, and only the
+        # longest-idle ones are evicted to make room, so a flood of new keys
+        # cannot reset the limits of active clients.
+        while self._buckets:
+            key, (_, last, refill) = next(iter(self._buckets.items()))
+            if now - last < refill and len(self._buckets) < self.max_keys:
+                break
+            del self._buckets[key]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return tostring(retry_after)
+"""
+
+
+class RedisRateLimitBackend:
+    """Token buckets kept in Redis so every worker shares the same limits.
+
+    The bucket update runs as one Lua script, so each check is a single
+    round trip and atomic across workers. Redis errors fail open.
+    """
+
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis
+
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url, socket_timeout=0.05, socket_connect_timeout=0.5)
+        self._script = self._client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def hit(self, key: str, rule: RateLimitRule) -> float:
+        try:
+            return float(self._script(keys=[self.prefix + key], args=[rule.rate, rule.capacity]))
+        except Exception as exc:
+            logger.warning(f"Rate limit backend unavailable, allowing request: {exc}")
+            return 0.0
+
+    def reset(self) -> None:
+        for key in self._client.scan_iter(match=self.prefix + "*"):
+            self._client.delete(key)
+
+
+class RateLimiter:
+    def __init__(self, backend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self._rules: dict[str, RateLimitRule] = {}
+
+    def rule(self, value: str) -> RateLimitRule:
+        rule = self._rules.get(value)
+        if rule is None:
+            rule = self._rules[value] = RateLimitRule.parse(value)
+        return rule
+
+    def check(self, scope: str, identity: str, limit: str) -> Optional[float]:
+        """Return seconds to wait when ``identity`` exceeded ``limit`` on ``scope``, else None"""
+        if not self.enabled:
+            return None
+
+        retry_after = self.backend.hit(f"{scope}:{identity}", self.rule(limit))
+        return retry_after if retry_after > 0 else None
+
+
+def create_backend():
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(settings.REDIS_URL)
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return InMemoryRateLimitBackend()
+    raise ValueError(f"Unknown rate limit backend: {settings.RATE_LIMIT_BACKEND}")
+
+
+limiter = RateLimiter(create_backend(), enabled=settings.RATE_LIMIT_ENABLED)
@@ -1,6 +1,7 @@
 from passlib.context import CryptContext
 from app.core.config import settings
 from datetime import datetime, timedelta
+from typing import Optional
 from jose import jwt
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -11,11 +12,12 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
-def create_access_token(subject: str) -> str:
+def create_access_token(subject: str, claims: Optional[dict] = None) -> str:
     expire = datetime.utcnow() + timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
     payload = {
+        **(claims or {}),
         "sub": subject,
         "exp": expire,
         "type": "access",
@@ -0,0 +1,205 @@
+import heapq
+import logging
+import threading
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_FIELDS = ("asset_code", "serial_number")
+
+
+def normalize(value: str) -> str:
+    # Codes are usually stored upper-case already; reusing the same object as
+    # key and value then costs nothing extra per entry.
+    key = value.upper()
+    return value if key == value else key
+
+
+class PrefixIndex:
+    """Sorted array of normalized keys with their original values.
+
+    Lookups are a bisect plus a linear walk over the matches, so they cost
+    O(log n + k). Inserts and removals shift the arrays (O(n) memmove),
+    roughly 1-2 ms each at 1M entries; writes are rare next to lookups.
+    """
+
+    def __init__(self, pairs: Iterable[tuple[str, str]] = ()):
+        pairs = sorted(pairs)
+        self._keys = [key for key, _ in pairs]
+        self._values = [value for _, value in pairs]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, value: str) -> None:
+        key = normalize(value)
+        i = bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i] == key:
+            if self._values[i] == value:
+                return
+            i += 1
+        self._keys.insert(i, key)
+        self._values.insert(i, value)
+
+    def add_many(self, values: Iterable[str]) -> None:
+        """Merge many values in one O(n + m log m) pass instead of m array shifts"""
+        pairs = sorted((normalize(value), value) for value in values)
+        keys, merged = [], []
+        last = None
+        for pair in heapq.merge(zip(self._keys, self._values), pairs):
+            if pair != last:
+                keys.append(pair[0])
+                merged.append(pair[1])
+                last = pair
+        self._keys, self._values = keys, merged
+
+    def remove(self, value: str) -> None:
+        key = normalize(value)
+        i = bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i] == key:
+            if self._values[i] == value:
+                del self._keys[i]
+                del self._values[i]
+                return
+            i += 1
+
+    def search(self, prefix: str, limit: int) -> list[str]:
+        prefix = normalize(prefix)
+        i = bisect_left(self._keys, prefix)
+        matches = []
+        while i < len(self._keys) and len(matches) < limit and self._keys[i].startswith(prefix):
+            matches.append(self._values[i])
+            i += 1
+        return matches
+
+
+class AssetSuggestIndex:
+    """Per-process prefix index over ``asset_code`` and ``serial_number``.
+
+    Built in the background at startup and kept current by the asset
+    repository on create/update/delete. Writes made by other workers only
+    show up after the next periodic rebuild. While the index is not ready,
+    or after it grew past ``max_entries``, ``suggest`` returns None and the
+    caller falls back to the database.
+
+    Memory: an entry costs ~80 bytes (key string plus two list slots), or
+    ~145 bytes when the value is not already upper-case and needs its own
+    normalized key. 1M assets indexed on both fields is ~160 MB.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._indexes = {field: PrefixIndex() for field in SUGGEST_FIELDS}
+        self._ready = False
+        self._journal: Optional[list[tuple[str, str, str]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self._indexes.values())
+
+    def _apply(self, op: str, field: str, value: str) -> None:
+        if op == "add":
+            self._indexes[field].add(value)
+        else:
+            self._indexes[field].remove(value)
+
+    def _record(self, op: str, field: str, value: Optional[str]) -> None:
+        if not value:
+            return
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((op, field, value))
+            if not self._ready:
+                return
+            self._apply(op, field, value)
+            if op == "add" and len(self) > self.max_entries:
+                self._disable()
+
+    def _disable(self) -> None:
+        logger.warning(f"Asset suggest index exceeded {self.max_entries} entries; falling back to database")
+        self._indexes = {field: PrefixIndex() for field in SUGGEST_FIELDS}
+        self._ready = False
+
+    def add(self, field: str, value: Optional[str]) -> None:
+        self._record("add", field, value)
+
+    def remove(self, field: str, value: Optional[str]) -> None:
+        self._record("remove", field, value)
+
+    def add_many(self, field: str, values: Iterable[Optional[str]]) -> None:
+        values = [value for value in values if value]
+        if not values:
+            return
+        with self._lock:
+            if self._journal is not None:
+                self._journal.extend(("add", field, value) for value in values)
+            if not self._ready:
+                return
+            self._indexes[field].add_many(values)
+            if len(self) > self.max_entries:
+                self._disable()
+
+    def add_asset(self, asset) -> None:
+        for field in SUGGEST_FIELDS:
+            self.add(field, getattr(asset, field))
+
+    def remove_asset(self, asset) -> None:
+        for field in SUGGEST_FIELDS:
+            self.remove(field, getattr(asset, field))
+
+    def begin_rebuild(self) -> None:
+        """Start journaling writes that may be missed by the snapshot about to be read"""
+        with self._lock:
+            self._journal = []
+
+    def finish_rebuild(self, rows: Iterable[tuple[str, str]]) -> bool:
+        """Swap in an index built from ``(asset_code, serial_number)`` rows.
+
+        Returns False, leaving the index disabled, when the rows exceed
+        ``max_entries``.
+        """
+        columns = {field: [] for field in SUGGEST_FIELDS}
+        count = 0
+        try:
+            for row in rows:
+                for field, value in zip(SUGGEST_FIELDS, row):
+                    if value:
+                        columns[field].append((normalize(value), value))
+                        count += 1
+                if count > self.max_entries:
+                    with self._lock:
+                        self._disable()
+                    return False
+
+            indexes = {field: PrefixIndex(pairs) for field, pairs in columns.items()}
+            with self._lock:
+                self._indexes = indexes
+                for op, field, value in self._journal or ():
+                    self._apply(op, field, value)
+                self._ready = True
+            return True
+        finally:
+            with self._lock:
+                self._journal = None
+
+    def suggest(self, prefix: str, limit: int, fields: Iterable[str] = SUGGEST_FIELDS) -> Optional[list[dict]]:
+        with self._lock:
+            if not self._ready:
+                return None
+            suggestions = []
+            for field in fields:
+                for value in self._indexes[field].search(prefix, limit - len(suggestions)):
+                    suggestions.append({"value": value, "field": field})
+                if len(suggestions) >= limit:
+                    break
+            return suggestions
+
+
+asset_suggest_index = AssetSuggestIndex(max_entries=settings.ASSET_SUGGEST_MAX_ENTRIES)
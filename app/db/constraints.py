@@ -0,0 +1,51 @@
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from app.utils.exceptions import BaseAPIException, NotFoundException, ValidationException
+
+# Constraint names follow the naming convention in app/db/base.py
+CONSTRAINT_ERRORS: dict[str, Callable[[], BaseAPIException]] = {
+    "ix_assets_asset_code": lambda: ValidationException("Asset code already exists"),
+    "ix_assets_serial_number": lambda: ValidationException("Serial number already exists"),
+    "fk_assets_category_id_asset_categories": lambda: NotFoundException("Asset Category"),
+    "fk_assets_pic_user_id_users": lambda: NotFoundException("User"),
+    "ix_users_username": lambda: ValidationException("Username already exists"),
+    "ix_users_email": lambda: ValidationException("Email already exists"),
+    "fk_users_role_id_roles": lambda: NotFoundException("Role"),
+    "uq_asset_categories_name": lambda: ValidationException("Category name already exists"),
+    "uq_asset_loans_active_asset_id": lambda: ValidationException("Asset is not available for borrowing"),
+}
+
+
+def constraint_name(exc: IntegrityError) -> Optional[str]:
+    """Name of the violated constraint, from psycopg2's diagnostics or asyncpg's error"""
+    orig = exc.orig
+    name = getattr(getattr(orig, "diag", None), "constraint_name", None)
+    if name is None:
+        name = getattr(getattr(orig, "__cause__", None), "constraint_name", None)
+    return name
+
+
+def integrity_exception(exc: IntegrityError) -> Optional[BaseAPIException]:
+    factory = CONSTRAINT_ERRORS.get(constraint_name(exc))
+    return factory() if factory else None
+
+
+@contextmanager
+def translate_integrity_errors(db):
+    """Roll back and re-raise known constraint violations as API exceptions.
+
+    Lets writes rely on the database's unique and foreign key constraints
+    instead of checking first, which costs a round trip per check and is
+    racy anyway. Unknown violations propagate unchanged.
+    """
+    try:
+        yield
+    except IntegrityError as exc:
+        db.rollback()
+        error = integrity_exception(exc)
+        if error is None:
+            raise
+        raise error from exc
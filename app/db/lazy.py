@@ -0,0 +1,71 @@
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+REQUEST_SESSIONS_KEY = "db_sessions"
+
+
+class LazySession:
+    """Request-scoped proxy that only creates its Session on first use.
+
+    Handlers that fail on validation or permission checks never touch the
+    pool. The session is closed as soon as the response starts (see
+    ``ReleaseDBSessionMiddleware``), so it must not be used from a
+    streaming response body; open a dedicated session there instead.
+    """
+
+    def __init__(self, factory: Callable[[], Session]):
+        self._factory = factory
+        self._session: Optional[Session] = None
+
+    @property
+    def materialized(self) -> bool:
+        return self._session is not None
+
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    async def release(self) -> None:
+        if self._session is not None:
+            await run_in_threadpool(self._session.close)
+
+
+class LazyAsyncSession:
+    """``LazySession`` counterpart for ``AsyncSession``"""
+
+    def __init__(self, factory: Callable[[], AsyncSession]):
+        self._factory = factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def materialized(self) -> bool:
+        return self._session is not None
+
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    async def release(self) -> None:
+        await self.close()
+
+
+def track_request_session(scope_state: dict, session) -> None:
+    scope_state.setdefault(REQUEST_SESSIONS_KEY, []).append(session)
+
+
+async def release_request_sessions(scope_state: dict) -> None:
+    for session in scope_state.pop(REQUEST_SESSIONS_KEY, []):
+        await session.release()
@@ -0,0 +1,98 @@
+import logging
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTION_HOLD,
+    DB_POOL_OVERFLOW,
+    DB_POOL_PINGS,
+    DB_POOL_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+PRE_PING_POLICIES = ("always", "idle", "never")
+
+
+class _CheckoutTimingMixin:
+    """Times how long ``_do_get`` waits for a free connection"""
+
+    metrics_label = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(pool=self.metrics_label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(pool=self.metrics_label).observe(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(is_async: bool = False) -> dict:
+    """Engine keyword arguments derived from the ``DB_POOL_*`` settings"""
+    if settings.DB_POOL_PRE_PING not in PRE_PING_POLICIES:
+        raise ValueError(f"Unknown DB_POOL_PRE_PING policy: {settings.DB_POOL_PRE_PING}")
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
+
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """Attach pool metrics, and the idle pre-ping policy if configured, to ``engine``"""
+    pool = engine.pool
+    pool.metrics_label = label
+
+    DB_POOL_SIZE.labels(pool=label).set_function(pool.size)
+    DB_POOL_CHECKED_OUT.labels(pool=label).set_function(pool.checkedout)
+    DB_POOL_OVERFLOW.labels(pool=label).set_function(pool.overflow)
+
+    hold_time = DB_POOL_CONNECTION_HOLD.labels(pool=label)
+    idle_threshold = settings.DB_POOL_PRE_PING_IDLE_SECONDS
+    ping_idle = settings.DB_POOL_PRE_PING == "idle"
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        now = time.monotonic()
+        last_checkin = connection_record.info.get("last_checkin")
+
+        if ping_idle and last_checkin is not None and now - last_checkin > idle_threshold:
+            try:
+                alive = engine.dialect.do_ping(dbapi_connection)
+            except Exception:
+                alive = False
+            DB_POOL_PINGS.labels(pool=label, result="ok" if alive else "stale").inc()
+            if not alive:
+                # The pool discards this connection and retries with a fresh one
+                raise exc.DisconnectionError("Idle connection failed pre-ping")
+
+        connection_record.info["checkout_at"] = now
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        now = time.monotonic()
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        if checkout_at is not None:
+            hold_time.observe(now - checkout_at)
+        connection_record.info["last_checkin"] = now
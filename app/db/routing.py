@@ -0,0 +1,95 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """Round-robin over read replicas, skipping ones that recently failed"""
+
+    def __init__(self, engines: list[Engine], retry_seconds: float = 30):
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self._down_until: dict[int, float] = {}
+        self._cycle = itertools.cycle(range(len(engines)))
+        self._lock = threading.Lock()
+
+        for index, replica in enumerate(engines):
+            self._watch(index, replica)
+
+    def _watch(self, index: int, replica: Engine) -> None:
+        @event.listens_for(replica, "handle_error")
+        def on_error(context):
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(index)
+
+    def mark_down(self, index: int) -> None:
+        logger.warning(f"Read replica {index} unavailable, routing reads elsewhere for {self.retry_seconds}s")
+        with self._lock:
+            self._down_until[index] = time.monotonic() + self.retry_seconds
+
+    def pick(self) -> Optional[Engine]:
+        if not self.engines:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                index = next(self._cycle)
+                if self._down_until.get(index, 0) <= now:
+                    return self.engines[index]
+        return None
+
+
+class RoutingSession(Session):
+    """Session that sends reads to a replica and everything else to the primary.
+
+    Once the session flushes, executes DML or locks rows it stays pinned to
+    the primary, so reads after a write in the same request see that write.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Optional[ReplicaSet] = None,
+        use_replica: bool = False,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self.use_replica = use_replica
+        self._replica: Optional[Engine] = None
+        self._pinned_to_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self.use_replica or self.replicas is None or self._pinned_to_primary:
+            return self.primary
+
+        if self._flushing or self._is_write(clause):
+            self._pinned_to_primary = True
+            return self.primary
+
+        if self._replica is None:
+            self._replica = self.replicas.pick()
+        return self._replica or self.primary
+
+    @staticmethod
+    def _is_write(clause) -> bool:
+        if clause is None:
+            return False
+        if getattr(clause, "is_dml", False):
+            return True
+        return getattr(clause, "_for_update_arg", None) is not None
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_after_flush(session, flush_context):
+    session._pinned_to_primary = True
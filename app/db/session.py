@@ -1,7 +1,60 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.pool import instrument_engine, pool_options
+from app.db.routing import ReplicaSet, RoutingSession
+from app.db.table_versions import track_table_versions
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+def to_async_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def get_async_database_url() -> str:
+    return settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+
+
+engine = create_engine(settings.DATABASE_URL, **pool_options())
+instrument_engine(engine, "primary")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_engine(get_async_database_url(), **pool_options(is_async=True))
+instrument_engine(async_engine.sync_engine, "primary_async")
+
+replica_engines = []
+async_replica_engines = []
+for index, replica_url in enumerate(settings.replica_urls):
+    replica_engine = create_engine(replica_url, **pool_options())
+    instrument_engine(replica_engine, f"replica_{index}")
+    replica_engines.append(replica_engine)
+
+    async_replica_engine = create_async_engine(to_async_url(replica_url), **pool_options(is_async=True))
+    instrument_engine(async_replica_engine.sync_engine, f"replica_{index}_async")
+    async_replica_engines.append(async_replica_engine.sync_engine)
+
+replicas = ReplicaSet(replica_engines, retry_seconds=settings.DB_REPLICA_RETRY_SECONDS)
+async_replicas = ReplicaSet(async_replica_engines, retry_seconds=settings.DB_REPLICA_RETRY_SECONDS)
+
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    primary=engine,
+    replicas=replicas,
+    use_replica=True,
+)
+track_table_versions(SessionLocal, engine)
+track_table_versions(ReadSessionLocal, engine)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    primary=async_engine.sync_engine,
+    replicas=async_replicas,
+    use_replica=True,
+)
@@ -0,0 +1,69 @@
+import logging
+from itertools import chain
+
+from sqlalchemy import event, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+from app.models.table_version import TableVersion
+
+logger = logging.getLogger(__name__)
+
+VERSIONED_TABLES = frozenset({"assets", "asset_categories", "users"})
+
+_CHANGED_KEY = "changed_tables"
+
+
+def _track(session: Session, table_names) -> None:
+    changed = VERSIONED_TABLES.intersection(table_names)
+    if changed:
+        session.info.setdefault(_CHANGED_KEY, set()).update(changed)
+
+
+def _track_flush(session: Session, flush_context) -> None:
+    _track(session, {obj.__table__.name for obj in chain(session.new, session.dirty, session.deleted)})
+
+
+def _track_statement(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _track(state.session, {state.statement.table.name})
+
+
+def bump_table_versions(engine: Engine, table_names) -> None:
+    """Increment the counters of ``table_names`` in a transaction of their own.
+
+    Rows are updated in name order so concurrent bumps cannot deadlock, and
+    each lock is held only for this short transaction.
+    """
+    with engine.begin() as connection:
+        for table_name in sorted(table_names):
+            connection.execute(
+                update(TableVersion)
+                .where(TableVersion.table_name == table_name)
+                .values(version=TableVersion.version + 1)
+            )
+
+
+def track_table_versions(session_factory: sessionmaker, engine: Engine) -> None:
+    """Bump ``table_versions`` after each commit that wrote to a versioned table.
+
+    Bumping after commit keeps the writer's transaction free of the shared
+    counter rows, and readers that see a new version are guaranteed to see
+    the data behind it (replicas replay both commits in order). A reader
+    that caches fresh data under the old version only wastes that entry.
+    Writes made outside the application's sessions do not bump versions.
+    """
+
+    def bump(session: Session) -> None:
+        changed = session.info.pop(_CHANGED_KEY, None)
+        if not changed:
+            return
+        try:
+            bump_table_versions(engine, changed)
+        except Exception as exc:
+            # The data is committed; list ETags stay stale until the next write
+            logger.warning(f"Could not bump table versions for {sorted(changed)}: {exc}")
+
+    event.listen(session_factory, "after_flush", _track_flush)
+    event.listen(session_factory, "do_orm_execute", _track_statement)
+    event.listen(session_factory, "after_commit", bump)
@@ -1,23 +1,82 @@
-from fastapi import FastAPI, Request, status
+import asyncio
+import secrets
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Header, Request, status
 from fastapi.responses import RedirectResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import auth, assets, borrows, users
+from app.api.v1 import auth, assets, borrows, categories, users
+from app.core.config import settings
+from app.core.metrics import metrics_response
+from app.db.session import ReadSessionLocal, async_engine
+from app.middlewares.db_session import ReleaseDBSessionMiddleware
+from app.services.asset_service import AssetService
+from app.services.borrow_service import sweep_overdue_loans_async
 from app.utils.exceptions import (
     BaseAPIException,
+    InvalidCredentialsException,
     create_error_response,
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def rebuild_asset_suggest_index():
+    with ReadSessionLocal() as db:
+        if AssetService.rebuild_suggest_index(db):
+            logger.info("Asset suggest index loaded")
+
+
+async def refresh_asset_suggest_index():
+    while True:
+        try:
+            await asyncio.to_thread(rebuild_asset_suggest_index)
+        except Exception:
+            logger.exception("Failed to load asset suggest index; suggestions fall back to database")
+        if settings.ASSET_SUGGEST_REFRESH_SECONDS <= 0:
+            return
+        await asyncio.sleep(settings.ASSET_SUGGEST_REFRESH_SECONDS)
+
+
+async def sweep_overdue_loans():
+    while True:
+        try:
+            swept = await sweep_overdue_loans_async(async_engine)
+            if swept:
+                logger.info(f"Marked {swept} loans as overdue")
+        except Exception:
+            logger.exception("Overdue loan sweep failed")
+        await asyncio.sleep(settings.LOAN_OVERDUE_SWEEP_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background_tasks = []
+    if settings.ASSET_SUGGEST_ENABLED:
+        background_tasks.append(asyncio.create_task(refresh_asset_suggest_index()))
+    if settings.LOAN_OVERDUE_SWEEP_ENABLED:
+        background_tasks.append(asyncio.create_task(sweep_overdue_loans()))
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+
+
 app = FastAPI(
     title="Cyber Asset Management",
     description="API for managing cyber assets, users, and borrows",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
+app.add_middleware(ReleaseDBSessionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -59,6 +118,19 @@ async def root():
 async def health_check():
     return {"status": "healthy", "message": "API is running"}
 
+def require_metrics_token(authorization: Optional[str] = Header(None)):
+    if not settings.METRICS_TOKEN:
+        return
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token, settings.METRICS_TOKEN):
+        raise InvalidCredentialsException("Invalid metrics token")
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+    def metrics():
+        return metrics_response()
+
 
 @app.exception_handler(BaseAPIException)
 async def api_exception_handler(request: Request, exc: BaseAPIException):
@@ -70,6 +142,7 @@ async def api_exception_handler(request: Request, exc: BaseAPIException):
         status_code=exc.status_code,
         detail=exc.detail,
         error_code=exc.error_code,
+        headers=exc.headers,
     )
 
 
@@ -152,5 +225,6 @@ async def general_exception_handler(request: Request, exc: Exception):
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Auth"])
 
 app.include_router(assets.router, prefix="/api/v1")
+app.include_router(categories.router, prefix="/api/v1")
 app.include_router(borrows.router, prefix="/api/v1")
 app.include_router(users.router, prefix="/api/v1")
@@ -0,0 +1,29 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.lazy import release_request_sessions
+
+
+class ReleaseDBSessionMiddleware:
+    """Return request DB sessions to the pool once the response starts.
+
+    FastAPI runs the teardown of ``yield`` dependencies only after the
+    response has been sent, which keeps connections checked out while the
+    body streams to slow clients.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                await release_request_sessions(state)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -4,3 +4,4 @@ from app.models.asset import Asset
 from app.models.asset_category import AssetCategory
 from app.models.borrow import Borrow
 from app.models.audit_log import AuditLog
+from app.models.table_version import TableVersion
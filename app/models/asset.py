@@ -1,13 +1,41 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, DateTime, ForeignKey, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, DateTime, ForeignKey, Index, Computed, func
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.db.base import Base
 
+# Text search configuration used for the generated search_vector column and for
+# parsing queries against it. "simple" does no stemming, which suits asset codes,
+# serial numbers and mixed Indonesian/English names alike.
+SEARCH_CONFIG = "simple"
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(asset_code, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(serial_number, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'D')"
+)
+
 class Asset(Base):
     __tablename__ = "assets"
+    __table_args__ = (
+        Index("ix_assets_created_at_id", "created_at", "id"),
+        Index(
+            "ix_assets_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_assets_asset_code_trgm", "asset_code",
+            postgresql_using="gin", postgresql_ops={"asset_code": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_assets_serial_number_trgm", "serial_number",
+            postgresql_using="gin", postgresql_ops={"serial_number": "gin_trgm_ops"},
+        ),
+        Index("ix_assets_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -39,6 +67,10 @@ class Asset(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), deferred=True
+    )
+
     category = relationship("AssetCategory", back_populates="assets")
     pic_user = relationship("User", foreign_keys=[pic_user_id], back_populates="managed_assets")
     borrows = relationship("Borrow", back_populates="asset")
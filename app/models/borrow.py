@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, Text, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Text, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -9,6 +9,22 @@ from app.models.enums import LoanStatus
 
 class Borrow(Base):
     __tablename__ = "asset_loans"
+    __table_args__ = (
+        # Match the newest-first keyset order of the loan listing
+        Index("ix_asset_loans_created_at_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_asset_loans_user_id_created_at", "user_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_asset_loans_loan_status_created_at", "loan_status", text("created_at DESC"), text("id DESC")),
+        # Only loans still out can become overdue; keeps the sweep index tiny
+        Index(
+            "ix_asset_loans_due_date_borrowed", "due_date",
+            postgresql_where=text("loan_status = 'borrowed'"),
+        ),
+        # At most one loan holds an asset at a time
+        Index(
+            "uq_asset_loans_active_asset_id", "asset_id", unique=True,
+            postgresql_where=text("loan_status IN ('borrowed', 'overdue')"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
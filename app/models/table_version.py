@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+class TableVersion(Base):
+    """Change counter per table, bumped right after every commit that wrote to it.
+
+    Backs the ETags and cache keys of list endpoints; see
+    ``app.db.table_versions`` for how writes are tracked.
+    """
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
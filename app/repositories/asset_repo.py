@@ -1,8 +1,40 @@
 import uuid
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Optional, List, Sequence, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
-from app.models.asset import Asset
+from sqlalchemy import func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from app.core.asset_cache import asset_cache
+from app.core.suggest_index import SUGGEST_FIELDS, asset_suggest_index
+from app.models.asset import Asset, SEARCH_CONFIG
+from app.models.asset_category import AssetCategory
+from app.models.user import User
+from app.repositories.search import (
+    text_search_headline,
+    text_search_vector,
+    trigram_search_condition,
+    web_search_query,
+)
+from app.utils.fieldsets import load_columns
+
+EXPAND_RELATIONS = {
+    "category": "category_id",
+    "pic_user": "pic_user_id",
+}
+
+EXPORT_COLUMNS = (
+    Asset.id,
+    Asset.asset_code,
+    Asset.name,
+    Asset.serial_number,
+    Asset.category_id,
+    Asset.current_status,
+    Asset.asset_condition,
+    Asset.description,
+    Asset.pic_user_id,
+    Asset.created_at,
+    Asset.updated_at,
+)
 
 
 class AssetRepository:
@@ -12,6 +44,8 @@ class AssetRepository:
         db.add(asset)
         db.commit()
         db.refresh(asset)
+        asset_suggest_index.add_asset(asset)
+        asset_cache.invalidate()
         return asset
 
     @staticmethod
@@ -30,34 +64,116 @@ class AssetRepository:
         return db.query(Asset).filter(Asset.serial_number == serial_number).first()
 
     @staticmethod
-    def get_all(
-        db: Session,
-        skip: int = 0,
-        limit: int = 100,
+    def get_existing_identifiers(
+        db: Session, asset_codes: Sequence[str], serial_numbers: Sequence[str]
+    ) -> Tuple[set, set]:
+        """Which of ``asset_codes`` / ``serial_numbers`` are already taken, in one query"""
+        if not asset_codes and not serial_numbers:
+            return set(), set()
+
+        rows = db.execute(
+            select(Asset.asset_code, Asset.serial_number).where(
+                or_(Asset.asset_code.in_(asset_codes), Asset.serial_number.in_(serial_numbers))
+            )
+        ).all()
+        return {code for code, _ in rows}, {serial for _, serial in rows}
+
+    @staticmethod
+    def insert_many(db: Session, rows: List[dict]) -> List[Tuple[uuid.UUID, str, str]]:
+        """Multi-row ``INSERT ... ON CONFLICT DO NOTHING`` without committing.
+
+        Returns ``(id, asset_code, serial_number)`` of the rows actually
+        inserted; rows that hit a unique constraint are skipped.
+        """
+        if not rows:
+            return []
+
+        stmt = (
+            insert(Asset)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(Asset.id, Asset.asset_code, Asset.serial_number)
+        )
+        return [tuple(row) for row in db.execute(stmt).all()]
+
+    @staticmethod
+    def filter_conditions(
         status: Optional[str] = None,
         category_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
-    ) -> List[Asset]:
-        query = db.query(Asset).options(
-            joinedload(Asset.category),
-            joinedload(Asset.pic_user)
-        )
+        search_mode: str = "contains",
+        pic_user_id: Optional[uuid.UUID] = None,
+    ) -> list:
+        conditions = []
 
         if status:
-            query = query.filter(Asset.current_status == status)
+            conditions.append(Asset.current_status == status)
 
         if category_id:
-            query = query.filter(Asset.category_id == category_id)
+            conditions.append(Asset.category_id == category_id)
+
+        if pic_user_id:
+            conditions.append(Asset.pic_user_id == pic_user_id)
 
         if search:
-            search_filter = or_(
-                Asset.name.ilike(f"%{search}%"),
-                Asset.asset_code.ilike(f"%{search}%"),
-                Asset.serial_number.ilike(f"%{search}%"),
+            conditions.append(
+                trigram_search_condition(
+                    [Asset.name, Asset.asset_code, Asset.serial_number], search, search_mode
+                )
+            )
+
+        return conditions
+
+    @staticmethod
+    def list_options(fields: Optional[Sequence[str]] = None, expand: Sequence[str] = ()) -> list:
+        """Column projection and opt-in joins for list queries"""
+        options = []
+        if fields is not None:
+            # created_at/id back the keyset cursor; FKs back the expanded joins
+            required = ["id", "created_at", *(EXPAND_RELATIONS[name] for name in expand)]
+            options.append(load_columns(Asset, fields, required))
+
+        if "category" in expand:
+            options.append(
+                joinedload(Asset.category).load_only(AssetCategory.id, AssetCategory.name)
+            )
+        if "pic_user" in expand:
+            options.append(
+                joinedload(Asset.pic_user).load_only(User.id, User.username, User.email)
             )
-            query = query.filter(search_filter)
 
-        return query.offset(skip).limit(limit).all()
+        return options
+
+    @staticmethod
+    def keyset_conditions(after: Optional[Tuple[datetime, uuid.UUID]]) -> list:
+        if after is None:
+            return []
+        return [tuple_(Asset.created_at, Asset.id) > tuple_(*after)]
+
+    @staticmethod
+    def get_all(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+        search: Optional[str] = None,
+        search_mode: str = "contains",
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        fields: Optional[Sequence[str]] = None,
+        expand: Sequence[str] = (),
+    ) -> List[Asset]:
+        query = db.query(Asset).options(
+            *AssetRepository.list_options(fields, expand)
+        ).filter(
+            *AssetRepository.filter_conditions(status, category_id, search, search_mode),
+            *AssetRepository.keyset_conditions(after),
+        ).order_by(Asset.created_at, Asset.id)
+
+        if after is None and skip:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
 
     @staticmethod
     def count(
@@ -65,37 +181,190 @@ class AssetRepository:
         status: Optional[str] = None,
         category_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
+        search_mode: str = "contains",
     ) -> int:
-        query = db.query(Asset)
+        query = db.query(Asset).filter(
+            *AssetRepository.filter_conditions(status, category_id, search, search_mode)
+        )
 
-        if status:
-            query = query.filter(Asset.current_status == status)
+        return query.count()
 
-        if category_id:
-            query = query.filter(Asset.category_id == category_id)
+    @staticmethod
+    def text_search_conditions(tsquery: Any) -> list:
+        # The category name lives in another table, so it cannot be part of the
+        # generated search_vector; matching category ids are resolved separately
+        # (asset_categories is small) and OR-ed with the GIN-indexed match.
+        matching_categories = select(AssetCategory.id).where(
+            text_search_vector(AssetCategory.name, SEARCH_CONFIG).bool_op("@@")(tsquery)
+        )
+        return [
+            or_(
+                Asset.search_vector.bool_op("@@")(tsquery),
+                Asset.category_id.in_(matching_categories),
+            )
+        ]
 
-        if search:
-            search_filter = or_(
-                Asset.name.ilike(f"%{search}%"),
-                Asset.asset_code.ilike(f"%{search}%"),
-                Asset.serial_number.ilike(f"%{search}%"),
+    @staticmethod
+    def search_statement(
+        query: str,
+        skip: int = 0,
+        limit: int = 20,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+    ):
+        """Select ``(Asset, rank, name_highlight, description_highlight)`` best match first.
+
+        Ranking and paging run in a subquery so ``ts_headline`` is only
+        evaluated for the rows of the requested page.
+        """
+        tsquery = web_search_query(query, SEARCH_CONFIG)
+        document = Asset.search_vector.op("||")(
+            text_search_vector(AssetCategory.name, SEARCH_CONFIG, weight="C")
+        )
+        rank = func.ts_rank(document, tsquery).label("rank")
+
+        ranked = (
+            select(Asset.id, rank)
+            .join(AssetCategory, AssetCategory.id == Asset.category_id)
+            .where(
+                *AssetRepository.text_search_conditions(tsquery),
+                *AssetRepository.filter_conditions(status, category_id),
             )
-            query = query.filter(search_filter)
+            .order_by(rank.desc(), Asset.id)
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
 
-        return query.count()
+        return (
+            select(
+                Asset,
+                ranked.c.rank,
+                text_search_headline(Asset.name, tsquery, SEARCH_CONFIG).label("name_highlight"),
+                text_search_headline(Asset.description, tsquery, SEARCH_CONFIG).label("description_highlight"),
+            )
+            .join(ranked, ranked.c.id == Asset.id)
+            .order_by(ranked.c.rank.desc(), Asset.id)
+        )
+
+    @staticmethod
+    def search_count_statement(
+        query: str,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+    ):
+        tsquery = web_search_query(query, SEARCH_CONFIG)
+        return select(func.count()).select_from(Asset).where(
+            *AssetRepository.text_search_conditions(tsquery),
+            *AssetRepository.filter_conditions(status, category_id),
+        )
+
+    @staticmethod
+    def search(
+        db: Session,
+        query: str,
+        skip: int = 0,
+        limit: int = 20,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+    ) -> List[Tuple[Asset, float, str, str]]:
+        stmt = AssetRepository.search_statement(query, skip, limit, status, category_id)
+        return [tuple(row) for row in db.execute(stmt).all()]
+
+    @staticmethod
+    def count_search(
+        db: Session,
+        query: str,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+    ) -> int:
+        return db.execute(AssetRepository.search_count_statement(query, status, category_id)).scalar_one()
 
     @staticmethod
     def update(db: Session, asset: Asset, update_data: dict) -> Asset:
+        previous = AssetRepository.suggest_values(asset)
         for key, value in update_data.items():
             if value is not None:
                 setattr(asset, key, value)
         
         db.commit()
         db.refresh(asset)
+        AssetRepository.sync_suggest_index(previous, AssetRepository.suggest_values(asset))
+        asset_cache.invalidate()
         return asset
 
     @staticmethod
     def delete(db: Session, asset: Asset) -> None:
+        previous = AssetRepository.suggest_values(asset)
         db.delete(asset)
         db.commit()
+        AssetRepository.sync_suggest_index(previous, {})
+        asset_cache.invalidate()
+
+    @staticmethod
+    def bulk_update(db: Session, conditions: list, values: dict) -> List[uuid.UUID]:
+        """Set-based ``UPDATE ... RETURNING id`` without committing"""
+        stmt = update(Asset).where(*conditions).values(**values).returning(Asset.id)
+        return list(db.execute(stmt, execution_options={"synchronize_session": False}).scalars())
+
+    @staticmethod
+    def suggest_values(asset: Asset) -> dict:
+        return {field: getattr(asset, field) for field in SUGGEST_FIELDS}
+
+    @staticmethod
+    def sync_suggest_index(previous: dict, current: dict) -> None:
+        for field in SUGGEST_FIELDS:
+            if previous.get(field) != current.get(field):
+                asset_suggest_index.remove(field, previous.get(field))
+                asset_suggest_index.add(field, current.get(field))
 
+    @staticmethod
+    def suggest(db: Session, prefix: str, limit: int = 10, fields=SUGGEST_FIELDS) -> List[dict]:
+        """Database fallback for prefix suggestions while the in-memory index is unavailable"""
+        suggestions = []
+        for field in fields:
+            column = getattr(Asset, field)
+            rows = db.execute(
+                select(column)
+                .where(column.istartswith(prefix, autoescape=True))
+                .order_by(column)
+                .limit(limit - len(suggestions))
+            ).scalars()
+            suggestions.extend({"value": value, "field": field} for value in rows)
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+
+    @staticmethod
+    def iter_suggest_values(db: Session, batch_size: int = 10000):
+        """Stream ``(asset_code, serial_number)`` for every asset"""
+        result = db.execute(
+            select(Asset.asset_code, Asset.serial_number).execution_options(yield_per=batch_size)
+        )
+        for row in result:
+            yield tuple(row)
+
+    @staticmethod
+    def iter_export_rows(
+        db: Session,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+        search: Optional[str] = None,
+        search_mode: str = "contains",
+        batch_size: int = 2000,
+    ):
+        """Stream export rows (asset columns plus category and PIC names) through a server-side cursor"""
+        stmt = (
+            select(
+                *EXPORT_COLUMNS,
+                AssetCategory.name.label("category_name"),
+                User.username.label("pic_username"),
+            )
+            .join(AssetCategory, Asset.category_id == AssetCategory.id)
+            .outerjoin(User, Asset.pic_user_id == User.id)
+            .where(*AssetRepository.filter_conditions(status, category_id, search, search_mode))
+            .order_by(Asset.created_at, Asset.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in db.execute(stmt).mappings():
+            yield row
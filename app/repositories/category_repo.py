@@ -0,0 +1,75 @@
+import uuid
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.models.asset import Asset
+from app.models.asset_category import AssetCategory
+
+
+class CategoryRepository:
+    @staticmethod
+    def create(db: Session, category_data: dict) -> AssetCategory:
+        category = AssetCategory(**category_data)
+        db.add(category)
+        db.commit()
+        db.refresh(category)
+        return category
+
+    @staticmethod
+    def get_by_id(db: Session, category_id: uuid.UUID) -> Optional[AssetCategory]:
+        return db.query(AssetCategory).filter(AssetCategory.id == category_id).first()
+
+    @staticmethod
+    def get_by_name(db: Session, name: str) -> Optional[AssetCategory]:
+        return db.query(AssetCategory).filter(func.lower(AssetCategory.name) == name.lower()).first()
+
+    @staticmethod
+    def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[AssetCategory]:
+        return db.query(AssetCategory).order_by(AssetCategory.name).offset(skip).limit(limit).all()
+
+    @staticmethod
+    def count(db: Session) -> int:
+        return db.query(func.count(AssetCategory.id)).scalar()
+
+    @staticmethod
+    def get_id_names(db: Session) -> List[Tuple[uuid.UUID, str]]:
+        return [tuple(row) for row in db.execute(select(AssetCategory.id, AssetCategory.name))]
+
+    @staticmethod
+    def count_assets_by_status(
+        db: Session, category_ids: Sequence[uuid.UUID]
+    ) -> Dict[uuid.UUID, Dict[str, int]]:
+        """``{category_id: {status: count}}`` for ``category_ids`` from one grouped query"""
+        if not category_ids:
+            return {}
+
+        rows = db.execute(
+            select(Asset.category_id, Asset.current_status, func.count())
+            .where(Asset.category_id.in_(category_ids))
+            .group_by(Asset.category_id, Asset.current_status)
+        )
+        counts: Dict[uuid.UUID, Dict[str, int]] = {}
+        for category_id, status, count in rows:
+            counts.setdefault(category_id, {})[status] = count
+        return counts
+
+    @staticmethod
+    def has_assets(db: Session, category_id: uuid.UUID) -> bool:
+        return db.execute(
+            select(select(Asset.id).where(Asset.category_id == category_id).exists())
+        ).scalar()
+
+    @staticmethod
+    def update(db: Session, category: AssetCategory, update_data: dict) -> AssetCategory:
+        for key, value in update_data.items():
+            if value is not None:
+                setattr(category, key, value)
+
+        db.commit()
+        db.refresh(category)
+        return category
+
+    @staticmethod
+    def delete(db: Session, category: AssetCategory) -> None:
+        db.delete(category)
+        db.commit()
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from sqlalchemy import func, or_
+
+SEARCH_MODES = ("contains", "fuzzy")
+
+
+def trigram_search_condition(columns: list, term: str, mode: str = "contains"):
+    """OR-ed match of ``term`` over ``columns``, served by the pg_trgm GIN indexes.
+
+    ``contains`` is a case-insensitive substring match (ILIKE); the trigram
+    indexes answer it for terms of three or more characters. ``fuzzy`` uses
+    the pg_trgm similarity operator and tolerates typos.
+    """
+    if mode == "contains":
+        return or_(*[column.ilike(f"%{term}%") for column in columns])
+    if mode == "fuzzy":
+        return or_(*[column.op("%")(term) for column in columns])
+    raise ValueError(f"Unknown search mode: {mode}")
+
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=20, MinWords=5, MaxFragments=2"
+
+
+def web_search_query(term: str, config: str):
+    """Parse user input with ``websearch_to_tsquery`` (quotes, ``or`` and ``-`` supported)"""
+    return func.websearch_to_tsquery(config, term)
+
+
+def text_search_vector(column, config: str, weight: Optional[str] = None):
+    vector = func.to_tsvector(config, func.coalesce(column, ""))
+    return func.setweight(vector, weight) if weight else vector
+
+
+def html_escape(column):
+    """Escape ``&``, ``<`` and ``>`` in SQL (``&`` first so the others are not double-escaped)"""
+    escaped = func.replace(column, "&", "&amp;")
+    escaped = func.replace(escaped, "<", "&lt;")
+    return func.replace(escaped, ">", "&gt;")
+
+
+def text_search_headline(column, tsquery, config: str):
+    """HTML-safe snippet of ``column`` with the matched terms wrapped in ``<mark>``.
+
+    The column is escaped before ``ts_headline`` so the only markup in the
+    result is the ``<mark>`` tags it adds; stored values can never inject
+    HTML into a client that renders the highlight.
+    """
+    return func.ts_headline(config, html_escape(func.coalesce(column, "")), tsquery, HEADLINE_OPTIONS)
@@ -0,0 +1,19 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.table_version import TableVersion
+
+
+class TableVersionRepository:
+    @staticmethod
+    def get_versions(db: Session, table_names: Sequence[str]) -> dict[str, int]:
+        rows = db.execute(
+            select(TableVersion.table_name, TableVersion.version).where(
+                TableVersion.table_name.in_(table_names)
+            )
+        ).all()
+        versions = {table_name: 0 for table_name in table_names}
+        versions.update({table_name: version for table_name, version in rows})
+        return versions
@@ -1,8 +1,15 @@
 import uuid
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Sequence
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from sqlalchemy import select
+from app.models.role import Role
 from app.models.user import User
+from app.repositories.search import trigram_search_condition
+from app.utils.fieldsets import load_columns
+
+# Columns list queries load by default; password_hash and token_version stay unread
+LIST_COLUMNS = ("id", "role_id", "username", "email", "is_active", "created_at", "updated_at")
 
 
 class UserRepository:
@@ -20,6 +27,18 @@ class UserRepository:
             joinedload(User.role)
         ).filter(User.id == user_id).first()
 
+    @staticmethod
+    def get_existing_ids(db: Session, user_ids: Sequence[uuid.UUID]) -> set:
+        if not user_ids:
+            return set()
+        return set(db.execute(select(User.id).where(User.id.in_(user_ids))).scalars())
+
+    @staticmethod
+    def get_updated_at(db: Session, user_id: uuid.UUID) -> Optional[datetime]:
+        return db.execute(
+            select(User.updated_at).where(User.id == user_id)
+        ).scalar_one_or_none()
+
     @staticmethod
     def get_by_username(db: Session, username: str) -> Optional[User]:
         return db.query(User).options(
@@ -33,30 +52,51 @@ class UserRepository:
         ).filter(User.email == email).first()
 
     @staticmethod
-    def get_all(
-        db: Session,
-        skip: int = 0,
-        limit: int = 100,
+    def filter_conditions(
         is_active: Optional[bool] = None,
         role_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
-    ) -> List[User]:
-        query = db.query(User).options(
-            joinedload(User.role)
-        )
+        search_mode: str = "contains",
+    ) -> list:
+        conditions = []
 
         if is_active is not None:
-            query = query.filter(User.is_active == is_active)
+            conditions.append(User.is_active == is_active)
 
         if role_id:
-            query = query.filter(User.role_id == role_id)
+            conditions.append(User.role_id == role_id)
 
         if search:
-            search_filter = or_(
-                User.username.ilike(f"%{search}%"),
-                User.email.ilike(f"%{search}%"),
+            conditions.append(
+                trigram_search_condition([User.username, User.email], search, search_mode)
             )
-            query = query.filter(search_filter)
+
+        return conditions
+
+    @staticmethod
+    def list_options(fields: Optional[Sequence[str]] = None, expand: Sequence[str] = ()) -> list:
+        """Column projection and opt-in joins for list queries"""
+        required = ["id", "role_id"] if "role" in expand else ["id"]
+        options = [load_columns(User, LIST_COLUMNS if fields is None else fields, required)]
+        if "role" in expand:
+            options.append(joinedload(User.role).load_only(Role.id, Role.name))
+        return options
+
+    @staticmethod
+    def get_all(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        role_id: Optional[uuid.UUID] = None,
+        search: Optional[str] = None,
+        search_mode: str = "contains",
+        fields: Optional[Sequence[str]] = None,
+        expand: Sequence[str] = (),
+    ) -> List[User]:
+        query = db.query(User).options(
+            *UserRepository.list_options(fields, expand)
+        ).filter(*UserRepository.filter_conditions(is_active, role_id, search, search_mode))
 
         return query.offset(skip).limit(limit).all()
 
@@ -66,21 +106,11 @@ class UserRepository:
         is_active: Optional[bool] = None,
         role_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
+        search_mode: str = "contains",
     ) -> int:
-        query = db.query(User)
-
-        if is_active is not None:
-            query = query.filter(User.is_active == is_active)
-
-        if role_id:
-            query = query.filter(User.role_id == role_id)
-
-        if search:
-            search_filter = or_(
-                User.username.ilike(f"%{search}%"),
-                User.email.ilike(f"%{search}%"),
-            )
-            query = query.filter(search_filter)
+        query = db.query(User).filter(
+            *UserRepository.filter_conditions(is_active, role_id, search, search_mode)
+        )
 
         return query.count()
 
@@ -98,4 +128,3 @@ class UserRepository:
     def delete(db: Session, user: User) -> None:
         db.delete(user)
         db.commit()
-
@@ -1,8 +1,11 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 import uuid
 
+# Upper bound on assets one PATCH /assets/bulk call may touch, by ids or by filter
+ASSET_BULK_MAX = 1000
+
 
 class AssetBase(BaseModel):
     asset_code: str = Field(..., min_length=1, max_length=100)
@@ -29,6 +32,28 @@ class AssetUpdate(BaseModel):
     pic_user_id: Optional[uuid.UUID] = None
 
 
+class AssetBulkFilter(BaseModel):
+    status: Optional[str] = None
+    category_id: Optional[uuid.UUID] = None
+    pic_user_id: Optional[uuid.UUID] = None
+    search: Optional[str] = Field(None, min_length=1)
+    search_mode: Literal["contains", "fuzzy"] = "contains"
+
+
+class AssetBulkPatch(BaseModel):
+    category_id: Optional[uuid.UUID] = None
+    current_status: Optional[str] = Field(None, min_length=1, max_length=50)
+    asset_condition: Optional[str] = Field(None, max_length=50)
+    description: Optional[str] = None
+    pic_user_id: Optional[uuid.UUID] = None
+
+
+class AssetBulkUpdate(BaseModel):
+    ids: Optional[List[uuid.UUID]] = Field(None, min_length=1, max_length=ASSET_BULK_MAX)
+    filter: Optional[AssetBulkFilter] = None
+    patch: AssetBulkPatch
+
+
 class AssetResponse(AssetBase):
     id: uuid.UUID
     created_at: datetime
@@ -37,3 +62,30 @@ class AssetResponse(AssetBase):
     class Config:
         from_attributes = True
 
+
+
+class AssetCategorySummary(BaseModel):
+    id: uuid.UUID
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
+class AssetSummary(BaseModel):
+    id: uuid.UUID
+    asset_code: str
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
+class AssetSearchHighlight(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+
+class AssetSearchResult(AssetResponse):
+    rank: float
+    highlight: AssetSearchHighlight
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 import uuid
 from app.models.enums import LoanStatus
@@ -20,6 +20,14 @@ class LoanStatusUpdate(BaseModel):
     status: Optional[LoanStatus] = None
     notes: Optional[str] = None
 
+class LoanBatchItem(BaseModel):
+    loan_id: uuid.UUID
+    action: Literal["approve", "reject"]
+    notes: Optional[str] = None
+
+class LoanBatchReview(BaseModel):
+    items: List[LoanBatchItem] = Field(..., min_length=1, max_length=500)
+
 class LoanResponse(BaseModel):
     id: uuid.UUID
     asset_id: uuid.UUID
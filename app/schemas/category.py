@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+from typing import Dict, Optional
+from datetime import datetime
+import uuid
+
+
+class CategoryBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = None
+
+
+class CategoryCreate(CategoryBase):
+    pass
+
+
+class CategoryUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = None
+
+
+class CategoryResponse(CategoryBase):
+    id: uuid.UUID
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class CategoryAssetCounts(BaseModel):
+    total: int = 0
+    by_status: Dict[str, int] = Field(default_factory=dict)
@@ -34,3 +34,20 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+
+class RoleSummary(BaseModel):
+    id: uuid.UUID
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
+class UserSummary(BaseModel):
+    id: uuid.UUID
+    username: str
+    email: str
+
+    class Config:
+        from_attributes = True
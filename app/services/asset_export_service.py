@@ -0,0 +1,146 @@
+import csv
+import io
+import json
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from sqlalchemy.orm import Session
+
+from app.repositories.asset_repo import AssetRepository
+
+EXPORT_FIELDS = (
+    "id",
+    "asset_code",
+    "name",
+    "serial_number",
+    "category_id",
+    "category_name",
+    "current_status",
+    "asset_condition",
+    "description",
+    "pic_user_id",
+    "pic_username",
+    "created_at",
+    "updated_at",
+)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Rows per yielded chunk; each chunk is one threadpool hop in StreamingResponse
+CHUNK_ROWS = 500
+FILE_CHUNK_BYTES = 64 * 1024
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_chunks(rows: Iterable) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so Excel opens UTF-8 names correctly
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_FIELDS)
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, CHUNK_ROWS))
+        if not chunk:
+            break
+        writer.writerows([_text(row[field]) for field in EXPORT_FIELDS] for row in chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _ndjson_chunks(rows: Iterable) -> Iterator[bytes]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, CHUNK_ROWS))
+        if not chunk:
+            break
+        yield "".join(
+            json.dumps({field: row[field] for field in EXPORT_FIELDS}, default=_text, ensure_ascii=False) + "\n"
+            for row in chunk
+        ).encode()
+
+
+def _xlsx_value(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        # Excel has no time zones; export UTC wall-clock time
+        return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def _xlsx_chunks(rows: Iterable) -> Iterator[bytes]:
+    # Write-only mode spools rows to a temp file instead of keeping cells in
+    # memory; the zip container can only be streamed once it is complete.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Assets")
+    sheet.append(EXPORT_FIELDS)
+    for row in rows:
+        sheet.append([_xlsx_value(row[field]) for field in EXPORT_FIELDS])
+
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while True:
+            data = output.read(FILE_CHUNK_BYTES)
+            if not data:
+                break
+            yield data
+
+
+WRITERS = {
+    "csv": _csv_chunks,
+    "ndjson": _ndjson_chunks,
+    "xlsx": _xlsx_chunks,
+}
+
+
+class AssetExportService:
+    @staticmethod
+    def filename(export_format: str) -> str:
+        return f"assets-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.{export_format}"
+
+    @staticmethod
+    def stream_assets(
+        session_factory: Callable[[], Session],
+        export_format: str,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+        search: Optional[str] = None,
+        search_mode: str = "contains",
+    ) -> Iterator[bytes]:
+        """Yield the export file in chunks, reading assets through a server-side cursor.
+
+        Opens its own session because it runs while the response body
+        streams, after the request's session has been released.
+        """
+        with session_factory() as db:
+            rows = AssetRepository.iter_export_rows(
+                db,
+                status=status,
+                category_id=category_id,
+                search=search,
+                search_mode=search_mode,
+            )
+            yield from WRITERS[export_format](rows)
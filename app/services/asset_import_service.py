@@ -0,0 +1,250 @@
+import csv
+import io
+import uuid
+import zipfile
+from itertools import islice
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+
+from app.core.asset_cache import asset_cache
+from app.core.config import settings
+from app.core.suggest_index import asset_suggest_index
+from app.models.user import User
+from app.repositories.asset_repo import AssetRepository
+from app.repositories.user_repo import UserRepository
+from app.schemas.asset import AssetCreate
+from app.services.category_service import CategoryService
+from app.utils.audit import create_audit_logs_bulk
+from app.utils.exceptions import ValidationException
+
+IMPORT_FORMATS = ("csv", "xlsx")
+
+asset_list_adapter = TypeAdapter(list[AssetCreate])
+
+
+def _normalize_header(value) -> str:
+    return str(value or "").strip().lower().replace(" ", "_")
+
+
+def _normalize_value(value) -> Optional[str]:
+    if value is None:
+        return None
+    # Spreadsheets hand numeric codes back as floats (1001.0)
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = str(value).strip()
+    return value or None
+
+
+def _csv_rows(file: BinaryIO) -> Iterator[list]:
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.reader(text)
+    finally:
+        text.detach()
+
+
+def _xlsx_rows(file: BinaryIO) -> Iterator[tuple]:
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def read_records(file: BinaryIO, file_format: str) -> Iterator[Tuple[int, dict]]:
+    """Stream ``(row_number, record)`` pairs; the first row is the header, blank rows are skipped"""
+    rows = _csv_rows(file) if file_format == "csv" else _xlsx_rows(file)
+    try:
+        header = [_normalize_header(value) for value in next(rows, ())]
+        for row_number, row in enumerate(rows, start=2):
+            record = {
+                name: value
+                for name, value in zip(header, map(_normalize_value, row))
+                if name and value is not None
+            }
+            if record:
+                yield row_number, record
+    except (csv.Error, UnicodeDecodeError, InvalidFileException, zipfile.BadZipFile) as exc:
+        raise ValidationException(f"Could not read {file_format.upper()} file: {exc}")
+
+
+def _validate(records: list[dict]) -> Tuple[list[Optional[AssetCreate]], dict[int, dict]]:
+    """Validate a whole batch at once; only batches with bad rows pay for a second pass"""
+    try:
+        return asset_list_adapter.validate_python(records), {}
+    except ValidationError as exc:
+        errors: dict[int, dict] = {}
+        for error in exc.errors():
+            index, *field = error["loc"]
+            errors.setdefault(index, {})[".".join(map(str, field)) or "row"] = error["msg"]
+
+    valid = iter(asset_list_adapter.validate_python([r for i, r in enumerate(records) if i not in errors]))
+    return [None if i in errors else next(valid) for i in range(len(records))], errors
+
+
+class ImportReport:
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.total_rows = 0
+        self.valid = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[dict] = []
+
+    def fail(self, row: int, errors: dict) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row, "errors": errors})
+
+    def to_dict(self) -> dict:
+        return {
+            "total_rows": self.total_rows,
+            "valid": self.valid,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+class AssetImportService:
+    @staticmethod
+    def detect_format(filename: Optional[str]) -> str:
+        extension = (filename or "").rsplit(".", 1)[-1].lower() if "." in (filename or "") else ""
+        if extension not in IMPORT_FORMATS:
+            raise ValidationException("Unsupported file type, upload a .csv or .xlsx file")
+        return extension
+
+    @staticmethod
+    def import_assets(
+        db: Session,
+        file: BinaryIO,
+        file_format: str,
+        user: User,
+        ip_address: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> dict:
+        """Import assets from a CSV/XLSX stream in batches of ``ASSET_IMPORT_BATCH_SIZE``.
+
+        Each batch is validated in one pass, checked against a single
+        prefetch of taken codes/serials and existing users, then inserted
+        with one multi-row ``INSERT ... ON CONFLICT DO NOTHING`` and one
+        audit insert, and committed. Bad rows are reported and skipped; they
+        never abort the import. Columns match ``AssetCreate``, and a
+        ``category`` column holding the category name may replace
+        ``category_id``.
+        """
+        category_names = CategoryService.get_category_names(db)
+        categories = {name.lower(): category_id for category_id, name in category_names.items()}
+        category_ids = set(category_names)
+        missing_category_ids = set()
+
+        report = ImportReport(settings.ASSET_IMPORT_MAX_ERRORS)
+        seen_codes: set[str] = set()
+        seen_serials: set[str] = set()
+        imported_codes: list[str] = []
+        imported_serials: list[str] = []
+        records = read_records(file, file_format)
+        limited = islice(records, settings.ASSET_IMPORT_MAX_ROWS)
+
+        try:
+            while True:
+                batch = list(islice(limited, settings.ASSET_IMPORT_BATCH_SIZE))
+                if not batch:
+                    break
+
+                report.total_rows += len(batch)
+
+                # Category names resolve against the cached category snapshot
+                candidates = []
+                for row_number, record in batch:
+                    category = record.pop("category", None)
+                    if category is not None and "category_id" not in record:
+                        if category.lower() not in categories:
+                            report.fail(row_number, {"category": f"Asset category '{category}' not found"})
+                            continue
+                        record["category_id"] = categories[category.lower()]
+                    candidates.append((row_number, record))
+
+                assets, errors = _validate([record for _, record in candidates])
+                valid_assets = [asset for asset in assets if asset is not None]
+
+                existing_codes, existing_serials = AssetRepository.get_existing_identifiers(
+                    db,
+                    [asset.asset_code for asset in valid_assets],
+                    [asset.serial_number for asset in valid_assets],
+                )
+                existing_users = UserRepository.get_existing_ids(
+                    db, list({asset.pic_user_id for asset in valid_assets if asset.pic_user_id})
+                )
+
+                rows = []
+                for index, ((row_number, _), asset) in enumerate(zip(candidates, assets)):
+                    if asset is None:
+                        report.fail(row_number, errors[index])
+                        continue
+
+                    problems = {}
+                    if asset.category_id not in category_ids:
+                        if asset.category_id not in missing_category_ids and CategoryService.category_exists(
+                            db, asset.category_id
+                        ):
+                            category_ids.add(asset.category_id)
+                        else:
+                            missing_category_ids.add(asset.category_id)
+                            problems["category_id"] = "Asset category not found"
+                    if asset.pic_user_id and asset.pic_user_id not in existing_users:
+                        problems["pic_user_id"] = "User not found"
+                    if asset.asset_code in existing_codes:
+                        problems["asset_code"] = "Asset code already exists"
+                    elif asset.asset_code in seen_codes:
+                        problems["asset_code"] = "Duplicate asset code in file"
+                    if asset.serial_number in existing_serials:
+                        problems["serial_number"] = "Serial number already exists"
+                    elif asset.serial_number in seen_serials:
+                        problems["serial_number"] = "Duplicate serial number in file"
+
+                    if problems:
+                        report.fail(row_number, problems)
+                        continue
+
+                    seen_codes.add(asset.asset_code)
+                    seen_serials.add(asset.serial_number)
+                    rows.append((row_number, {"id": uuid.uuid4(), **asset.model_dump()}))
+
+                report.valid += len(rows)
+                if dry_run or not rows:
+                    continue
+
+                inserted = AssetRepository.insert_many(db, [row for _, row in rows])
+                inserted_ids = {asset_id for asset_id, _, _ in inserted}
+                for row_number, row in rows:
+                    if row["id"] not in inserted_ids:
+                        # Taken by a concurrent write after the prefetch
+                        report.fail(row_number, {"row": "Asset code or serial number already exists"})
+
+                create_audit_logs_bulk(db, user, "create", "asset", [asset_id for asset_id, _, _ in inserted], ip_address)
+                db.commit()
+                asset_cache.invalidate()
+
+                report.imported += len(inserted)
+                imported_codes.extend(code for _, code, _ in inserted)
+                imported_serials.extend(serial for _, _, serial in inserted)
+
+            overflow = next(records, None)
+            if overflow is not None:
+                report.fail(overflow[0], {
+                    "row": f"Import is limited to {settings.ASSET_IMPORT_MAX_ROWS} rows, "
+                           "this and the following rows were not processed",
+                })
+        finally:
+            db.rollback()
+            asset_suggest_index.add_many("asset_code", imported_codes)
+            asset_suggest_index.add_many("serial_number", imported_serials)
+
+        return report.to_dict()
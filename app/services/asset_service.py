@@ -1,28 +1,34 @@
 import uuid
-from typing import Optional, List
+from typing import Callable, Optional, List, Sequence, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.db.constraints import translate_integrity_errors
+from app.core.asset_cache import asset_cache
+from app.core.suggest_index import SUGGEST_FIELDS, asset_suggest_index
 from app.models.asset import Asset
-from app.models.asset_category import AssetCategory
+from app.models.user import User
 from app.repositories.asset_repo import AssetRepository
+from app.repositories.table_version_repo import TableVersionRepository
+from app.schemas.asset import ASSET_BULK_MAX, AssetResponse
+from app.services.category_service import CategoryService
+from app.utils.audit import create_audit_logs_bulk
 from app.utils.exceptions import NotFoundException, ValidationException
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Fields a bulk patch may clear with an explicit null
+BULK_NULLABLE_FIELDS = ("asset_condition", "description", "pic_user_id")
 
 
 class AssetService:
     @staticmethod
     def create_asset(db: Session, asset_data: dict) -> Asset:
-        if AssetRepository.get_by_code(db, asset_data["asset_code"]):
-            raise ValidationException("Asset code already exists")
-
-        if AssetRepository.get_by_serial_number(db, asset_data["serial_number"]):
-            raise ValidationException("Serial number already exists")
-
-        category = db.query(AssetCategory).filter(
-            AssetCategory.id == asset_data["category_id"]
-        ).first()
-        if not category:
+        # Code/serial uniqueness and the PIC are enforced by constraints;
+        # the category check is served from the in-process category cache.
+        if not CategoryService.category_exists(db, asset_data["category_id"]):
             raise NotFoundException("Asset Category")
 
-        return AssetRepository.create(db, asset_data)
+        with translate_integrity_errors(db):
+            return AssetRepository.create(db, asset_data)
 
     @staticmethod
     def get_asset(db: Session, asset_id: uuid.UUID) -> Asset:
@@ -31,6 +37,29 @@ class AssetService:
             raise NotFoundException("Asset")
         return asset
 
+    @staticmethod
+    def get_asset_data(db: Session, asset_id: uuid.UUID) -> dict:
+        """Serialized ``AssetResponse`` of the asset, served from the asset cache.
+
+        The table version is read before the asset, so a miss on a lagging
+        replica is cached under the version that replica has seen.
+        """
+        return asset_cache.get_item(
+            asset_id,
+            sorted(AssetService.get_list_versions(db).items()),
+            lambda: AssetResponse.model_validate(AssetService.get_asset(db, asset_id)).model_dump(),
+        )
+
+    @staticmethod
+    def get_list_versions(db: Session, expand: Sequence[str] = ()) -> dict[str, int]:
+        """Change counters of every table an asset read (with ``expand``) reads from"""
+        table_names = ["assets"]
+        if "category" in expand:
+            table_names.append("asset_categories")
+        if "pic_user" in expand:
+            table_names.append("users")
+        return TableVersionRepository.get_versions(db, table_names)
+
     @staticmethod
     def get_assets(
         db: Session,
@@ -39,37 +68,232 @@ class AssetService:
         status: Optional[str] = None,
         category_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
+        search_mode: str = "contains",
     ) -> List[Asset]:
         return AssetRepository.get_all(
-            db, skip=skip, limit=limit, status=status, category_id=category_id, search=search
+            db,
+            skip=skip,
+            limit=limit,
+            status=status,
+            category_id=category_id,
+            search=search,
+            search_mode=search_mode,
         )
 
+    @staticmethod
+    def get_assets_page(
+        db: Session,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+        search: Optional[str] = None,
+        search_mode: str = "contains",
+        fields: Optional[Sequence[str]] = None,
+        expand: Sequence[str] = (),
+    ) -> Tuple[List[Asset], Optional[str]]:
+        """Page ordered by ``(created_at, id)``; ``cursor`` takes precedence over ``skip``"""
+        assets = AssetRepository.get_all(
+            db,
+            skip=skip,
+            limit=limit + 1,
+            status=status,
+            category_id=category_id,
+            search=search,
+            search_mode=search_mode,
+            after=decode_cursor(cursor),
+            fields=fields,
+            expand=expand,
+        )
+
+        next_cursor = None
+        if len(assets) > limit:
+            assets = assets[:limit]
+            next_cursor = encode_cursor(assets[-1].created_at, assets[-1].id)
+
+        return assets, next_cursor
+
+    @staticmethod
+    def get_assets_page_data(
+        db: Session,
+        serialize: Callable[[List[Asset]], list],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+        search: Optional[str] = None,
+        search_mode: str = "contains",
+        fields: Optional[Sequence[str]] = None,
+        expand: Sequence[str] = (),
+        versions: Optional[list] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """``get_assets_page`` with the items passed through ``serialize``, served from the asset cache.
+
+        ``serialize`` must depend only on ``fields`` and ``expand``, which are
+        part of the cache key. ``versions`` (from ``get_list_versions``) ties
+        the entry to the tables it was read from, so expanded categories and
+        users are refreshed when those tables change.
+        """
+        params = {
+            "limit": limit,
+            "cursor": cursor,
+            "skip": 0 if cursor else skip,
+            "status": status,
+            "category_id": category_id,
+            "search": search,
+            "search_mode": search_mode,
+            "fields": list(fields) if fields is not None else None,
+            "expand": sorted(expand),
+            "versions": versions,
+        }
+
+        def load():
+            assets, next_cursor = AssetService.get_assets_page(
+                db,
+                limit=limit,
+                cursor=cursor,
+                skip=skip,
+                status=status,
+                category_id=category_id,
+                search=search,
+                search_mode=search_mode,
+                fields=fields,
+                expand=expand,
+            )
+            return {"items": serialize(assets), "next_cursor": next_cursor}
+
+        page = asset_cache.get_list("page", params, load)
+        return page["items"], page["next_cursor"]
+
     @staticmethod
     def count_assets(
         db: Session,
         status: Optional[str] = None,
         category_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
+        search_mode: str = "contains",
+        versions: Optional[list] = None,
     ) -> int:
-        return AssetRepository.count(db, status=status, category_id=category_id, search=search)
+        """Number of matching assets, cached under ``versions`` (from ``get_list_versions``)"""
+        params = {
+            "status": status,
+            "category_id": category_id,
+            "search": search,
+            "search_mode": search_mode,
+            "versions": versions,
+        }
+        return asset_cache.get_list(
+            "count",
+            params,
+            lambda: AssetRepository.count(
+                db, status=status, category_id=category_id, search=search, search_mode=search_mode
+            ),
+        )
+
+    @staticmethod
+    def search_assets(
+        db: Session,
+        query: str,
+        skip: int = 0,
+        limit: int = 20,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+    ) -> List[Tuple[Asset, float, str, str]]:
+        return AssetRepository.search(
+            db, query, skip=skip, limit=limit, status=status, category_id=category_id
+        )
+
+    @staticmethod
+    def count_search_assets(
+        db: Session,
+        query: str,
+        status: Optional[str] = None,
+        category_id: Optional[uuid.UUID] = None,
+    ) -> int:
+        return AssetRepository.count_search(db, query, status=status, category_id=category_id)
+
+    @staticmethod
+    def suggest_assets(
+        db: Session,
+        prefix: str,
+        limit: int = 10,
+        fields: Tuple[str, ...] = SUGGEST_FIELDS,
+    ) -> List[dict]:
+        suggestions = asset_suggest_index.suggest(prefix, limit, fields)
+        if suggestions is None:
+            suggestions = AssetRepository.suggest(db, prefix, limit, fields)
+        return suggestions
+
+    @staticmethod
+    def rebuild_suggest_index(db: Session) -> bool:
+        asset_suggest_index.begin_rebuild()
+        return asset_suggest_index.finish_rebuild(AssetRepository.iter_suggest_values(db))
 
     @staticmethod
     def update_asset(db: Session, asset_id: uuid.UUID, update_data: dict) -> Asset:
         asset = AssetService.get_asset(db, asset_id)
 
-        if "serial_number" in update_data and update_data["serial_number"]:
-            existing = AssetRepository.get_by_serial_number(db, update_data["serial_number"])
-            if existing and existing.id != asset_id:
-                raise ValidationException("Serial number already exists")
-
         if "category_id" in update_data and update_data["category_id"]:
-            category = db.query(AssetCategory).filter(
-                AssetCategory.id == update_data["category_id"]
-            ).first()
-            if not category:
+            if not CategoryService.category_exists(db, update_data["category_id"]):
                 raise NotFoundException("Asset Category")
 
-        return AssetRepository.update(db, asset, update_data)
+        with translate_integrity_errors(db):
+            return AssetRepository.update(db, asset, update_data)
+
+    @staticmethod
+    def bulk_update_assets(
+        db: Session,
+        patch: dict,
+        user: User,
+        asset_ids: Optional[List[uuid.UUID]] = None,
+        filters: Optional[dict] = None,
+        ip_address: Optional[str] = None,
+    ) -> List[uuid.UUID]:
+        """Apply ``patch`` to ``asset_ids`` or to every asset matching ``filters``.
+
+        Runs as one ``UPDATE ... RETURNING`` plus one multi-row audit insert
+        in a single transaction. ``patch`` holds only the fields the client
+        sent, so an explicit null clears a nullable field such as the PIC.
+        A filter may match at most ``ASSET_BULK_MAX`` assets; anything
+        broader is rolled back and rejected. Returns the ids that were updated.
+        """
+        if (asset_ids is None) == (filters is None):
+            raise ValidationException("Provide either ids or filter")
+
+        if not patch:
+            raise ValidationException("Patch must set at least one field")
+
+        for field, value in patch.items():
+            if value is None and field not in BULK_NULLABLE_FIELDS:
+                raise ValidationException(f"{field} cannot be null")
+
+        if patch.get("category_id") and not CategoryService.category_exists(db, patch["category_id"]):
+            raise NotFoundException("Asset Category")
+
+        if asset_ids is not None:
+            conditions = [Asset.id.in_(asset_ids)]
+        else:
+            conditions = AssetRepository.filter_conditions(**filters)
+            if not conditions:
+                raise ValidationException("Filter must set at least one criterion")
+            # One row past the cap is enough to tell the filter is too broad
+            capped = select(Asset.id).where(*conditions).limit(ASSET_BULK_MAX + 1)
+            conditions = [Asset.id.in_(capped.scalar_subquery())]
+
+        # An unknown pic_user_id surfaces as a foreign key violation
+        with translate_integrity_errors(db):
+            updated_ids = AssetRepository.bulk_update(db, conditions, patch)
+        if len(updated_ids) > ASSET_BULK_MAX:
+            db.rollback()
+            raise ValidationException(
+                f"Filter matches more than {ASSET_BULK_MAX} assets; narrow it or update in smaller batches"
+            )
+        create_audit_logs_bulk(db, user, "update", "asset", updated_ids, ip_address)
+        db.commit()
+        asset_cache.invalidate()
+        return updated_ids
 
     @staticmethod
     def delete_asset(db: Session, asset_id: uuid.UUID) -> None:
@@ -1,29 +1,50 @@
 import uuid
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from starlette.concurrency import run_in_threadpool
 from jose import jwt, JWTError
 from app.models.user import User
 from app.core.security import (
-    verify_password,
     create_access_token,
     create_refresh_token,
 )
+from app.core.hashing import password_hasher
 from app.core.config import settings
+from app.core.auth_cache import build_access_claims
 from app.utils.exceptions import InvalidCredentialsException, InactiveUserException
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(User.email == email).first()
+def issue_access_token(user: User) -> str:
+    claims = build_access_claims(user) if settings.ACCESS_TOKEN_EMBED_CLAIMS else None
+    return create_access_token(str(user.id), claims=claims)
 
-    if not user or not verify_password(password, user.password_hash):
-        raise InvalidCredentialsException()
+def _get_login_user(db: Session, email: str) -> User:
+    return db.query(User).options(joinedload(User.role)).filter(User.email == email).first()
 
+def _issue_login_tokens(user: User) -> dict:
     if not user.is_active:
         raise InactiveUserException()
 
     return {
-        "access_token": create_access_token(str(user.id)),
+        "access_token": issue_access_token(user),
         "refresh_token": create_refresh_token(str(user.id)),
     }
 
+def authenticate_user(db: Session, email: str, password: str):
+    user = _get_login_user(db, email)
+
+    if not user or not password_hasher.verify(password, user.password_hash):
+        raise InvalidCredentialsException()
+
+    return _issue_login_tokens(user)
+
+async def authenticate_user_async(db: Session, email: str, password: str):
+    """Login without holding a request thread while bcrypt runs"""
+    user = await run_in_threadpool(_get_login_user, db, email)
+
+    if not user or not await password_hasher.verify_async(password, user.password_hash):
+        raise InvalidCredentialsException()
+
+    return _issue_login_tokens(user)
+
 def refresh_access_token(db: Session, refresh_token: str):
     try:
         payload = jwt.decode(
@@ -40,7 +61,7 @@ def refresh_access_token(db: Session, refresh_token: str):
         except (ValueError, TypeError):
             raise InvalidCredentialsException("Invalid user ID format")
         
-        user = db.query(User).filter(User.id == user_uuid).first()
+        user = db.query(User).options(joinedload(User.role)).filter(User.id == user_uuid).first()
         
         if not user:
             raise InvalidCredentialsException("User not found")
@@ -49,7 +70,7 @@ def refresh_access_token(db: Session, refresh_token: str):
             raise InactiveUserException()
         
         return {
-            "access_token": create_access_token(str(user.id)),
+            "access_token": issue_access_token(user),
             "refresh_token": create_refresh_token(str(user.id)),
         }
     except JWTError:
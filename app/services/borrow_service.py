@@ -1,13 +1,20 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, func, literal, or_, select, tuple_, update
 from app.models.borrow import Borrow
 from app.models.asset import Asset
 from app.models.user import User
 from app.models.enums import LoanStatus
 from app.utils.exceptions import NotFoundException, ValidationException
+from app.utils.fieldsets import load_columns
+from app.utils.audit import create_audit_logs_bulk
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.core.asset_cache import asset_cache
+from app.db.constraints import translate_integrity_errors
+from app.core.config import settings
 from app.core.permissions import RolePermission, Permission
 
 
@@ -39,6 +46,33 @@ class LoanStatusValidator:
             )
 
 
+def _loan_for_update(loan_id: uuid.UUID):
+    """Loan row locked ``FOR UPDATE`` so concurrent transitions on it run one at a time"""
+    return (
+        select(Borrow)
+        .where(Borrow.id == loan_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+def _asset_for_update(asset_id: uuid.UUID):
+    """Asset row locked ``FOR UPDATE``; always taken after the loan lock to keep lock order fixed"""
+    return (
+        select(Asset)
+        .where(Asset.id == asset_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+def _lock_loan(db: Session, loan_id: uuid.UUID) -> Borrow:
+    loan = db.execute(_loan_for_update(loan_id)).scalar_one_or_none()
+    if not loan:
+        raise NotFoundException("Loan")
+    return loan
+
+
 def create_loan_request(
     db: Session,
     user_id: uuid.UUID,
@@ -46,7 +80,8 @@ def create_loan_request(
     due_date: Optional[datetime] = None,
     notes: Optional[str] = None,
 ) -> Borrow:
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    # Serializes requests for the asset so the duplicate check below holds
+    asset = db.execute(_asset_for_update(asset_id)).scalar_one_or_none()
     if not asset:
         raise NotFoundException("Asset")
     
@@ -86,9 +121,7 @@ def approve_loan(
     approver_id: uuid.UUID,
     notes: Optional[str] = None,
 ) -> Borrow:
-    loan = db.query(Borrow).filter(Borrow.id == loan_id).first()
-    if not loan:
-        raise NotFoundException("Loan")
+    loan = _lock_loan(db, loan_id)
     
     LoanStatusValidator.validate_transition(loan.loan_status, LoanStatus.APPROVED.value)
     
@@ -110,9 +143,7 @@ def reject_loan(
     approver_id: uuid.UUID,
     notes: Optional[str] = None,
 ) -> Borrow:
-    loan = db.query(Borrow).filter(Borrow.id == loan_id).first()
-    if not loan:
-        raise NotFoundException("Loan")
+    loan = _lock_loan(db, loan_id)
     
     if loan.loan_status == LoanStatus.PENDING.value:
         LoanStatusValidator.validate_transition(loan.loan_status, LoanStatus.REJECTED.value)
@@ -127,10 +158,7 @@ def reject_loan(
     if notes:
         loan.notes = notes
     
-    asset = db.query(Asset).filter(Asset.id == loan.asset_id).first()
-    if asset:
-        asset.current_status = "available"
-    
+    # Pending and approved loans never claimed the asset, so its status stays as is
     db.commit()
     db.refresh(loan)
     
@@ -142,25 +170,27 @@ def start_borrowing(
     loan_id: uuid.UUID,
     user_id: uuid.UUID,
 ) -> Borrow:
-    loan = db.query(Borrow).filter(Borrow.id == loan_id).first()
-    if not loan:
-        raise NotFoundException("Loan")
+    loan = _lock_loan(db, loan_id)
 
     if str(loan.user_id) != str(user_id):
         raise ValidationException("You can only start borrowing your own approved loans")
     
     LoanStatusValidator.validate_transition(loan.loan_status, LoanStatus.BORROWED.value)
+
+    asset = db.execute(_asset_for_update(loan.asset_id)).scalar_one_or_none()
+    if not asset or asset.current_status != "available":
+        raise ValidationException("Asset is not available for borrowing")
     
     loan.loan_status = LoanStatus.BORROWED.value
     loan.borrowed_at = datetime.now(timezone.utc)
     loan.status_changed_at = datetime.now(timezone.utc)
-
-    asset = db.query(Asset).filter(Asset.id == loan.asset_id).first()
-    if asset:
-        asset.current_status = "borrowed"
+    asset.current_status = "borrowed"
     
-    db.commit()
+    # uq_asset_loans_active_asset_id still holds if a writer skips the asset lock
+    with translate_integrity_errors(db):
+        db.commit()
     db.refresh(loan)
+    asset_cache.invalidate()
     
     return loan
 
@@ -172,9 +202,7 @@ def return_loan(
     is_admin: bool = False,
     notes: Optional[str] = None,
 ) -> Borrow:
-    loan = db.query(Borrow).filter(Borrow.id == loan_id).first()
-    if not loan:
-        raise NotFoundException("Loan")
+    loan = _lock_loan(db, loan_id)
     
     if not is_admin and str(loan.user_id) != str(user_id):
         raise ValidationException("You can only return your own loans")
@@ -192,65 +220,251 @@ def return_loan(
     if notes:
         loan.notes = notes
     
-    asset = db.query(Asset).filter(Asset.id == loan.asset_id).first()
+    asset = db.execute(_asset_for_update(loan.asset_id)).scalar_one_or_none()
     if asset:
         asset.current_status = "available"
     
     db.commit()
     db.refresh(loan)
+    asset_cache.invalidate()
     
     return loan
 
 
-def check_overdue_loans(db: Session) -> list[Borrow]:
-    now = datetime.now(timezone.utc)
-    
-    overdue_loans = db.query(Borrow).filter(
-        and_(
-            Borrow.loan_status == LoanStatus.BORROWED.value,
-            Borrow.due_date.isnot(None),
-            Borrow.due_date < now
+BATCH_REVIEW_STATUSES = {
+    "approve": LoanStatus.APPROVED.value,
+    "reject": LoanStatus.REJECTED.value,
+}
+
+
+def batch_review_loans(
+    db: Session,
+    items: Sequence[dict],
+    approver: User,
+    ip_address: Optional[str] = None,
+) -> list[dict]:
+    """Approve or reject many loans in one transaction.
+
+    Current statuses come from a single locked ``IN (...)`` fetch and every
+    transition is checked against ``LoanStatusValidator`` in memory. The
+    valid ones are written by one ``UPDATE ... RETURNING`` plus one audit
+    insert per action. Invalid items are reported and never block the rest.
+    Returns one result per item, in request order; ``data`` holds the
+    updated loan's columns as a dict.
+    """
+    loan_ids = list(dict.fromkeys(item["loan_id"] for item in items))
+    current = dict(db.execute(
+        # Locking in id order keeps overlapping batches from deadlocking
+        select(Borrow.id, Borrow.loan_status).where(Borrow.id.in_(loan_ids)).order_by(Borrow.id).with_for_update()
+    ).all())
+
+    results = []
+    seen = set()
+    statuses: dict[uuid.UUID, str] = {}
+    notes: dict[uuid.UUID, str] = {}
+    for item in items:
+        loan_id, action = item["loan_id"], item["action"]
+        result = {"loan_id": loan_id, "action": action, "success": False, "error": None, "data": None}
+        results.append(result)
+
+        new_status = BATCH_REVIEW_STATUSES[action]
+        if loan_id in seen:
+            result["error"] = "Loan appears more than once in this batch"
+            continue
+        seen.add(loan_id)
+        if loan_id not in current:
+            result["error"] = "Loan not found"
+        elif not LoanStatusValidator.is_valid_transition(current[loan_id], new_status):
+            result["error"] = f"Invalid status transition from {current[loan_id]} to {new_status}"
+        else:
+            statuses[loan_id] = new_status
+            if item.get("notes"):
+                notes[loan_id] = item["notes"]
+
+    if not statuses:
+        db.rollback()
+        return results
+
+    values = {
+        "loan_status": case(statuses, value=Borrow.id),
+        "approved_by": approver.id,
+        "status_changed_at": datetime.now(timezone.utc),
+    }
+    if notes:
+        values["notes"] = case(notes, value=Borrow.id, else_=Borrow.notes)
+
+    updated = db.execute(
+        update(Borrow)
+        .where(Borrow.id.in_(list(statuses)))
+        .values(**values)
+        .returning(*Borrow.__table__.c)
+        .execution_options(synchronize_session=False)
+    ).mappings().all()
+    # Plain rows, not entities: the commit below would expire entities and
+    # serializing them would then reload each one with its own SELECT
+    loans = {row["id"]: dict(row) for row in updated}
+
+    for action in BATCH_REVIEW_STATUSES:
+        create_audit_logs_bulk(
+            db,
+            approver,
+            action,
+            "loan",
+            [loan_id for loan_id, status in statuses.items() if status == BATCH_REVIEW_STATUSES[action]],
+            ip_address,
         )
-    ).all()
-    
-    updated_loans = []
-    for loan in overdue_loans:
-        loan.loan_status = LoanStatus.OVERDUE.value
-        loan.status_changed_at = now
-        updated_loans.append(loan)
-    
     db.commit()
-    
-    return updated_loans
+
+    for result in results:
+        if result["error"] is None:
+            result["success"] = True
+            result["data"] = loans[result["loan_id"]]
+    return results
+
+
+# Arbitrary application-wide key for pg_try_advisory_lock; whoever holds it runs the sweep
+OVERDUE_SWEEP_LOCK_KEY = 7_246_010_023
+
+
+def _overdue_batch_statement(now: datetime, batch_size: int):
+    """Flip up to ``batch_size`` overdue loans in one ``UPDATE``.
+
+    The status is rendered inline so the planner can match the partial
+    ``ix_asset_loans_due_date_borrowed`` index even for prepared
+    statements; ``SKIP LOCKED`` keeps concurrent sweeps and loan
+    transitions from waiting on each other.
+    """
+    borrowed = literal(LoanStatus.BORROWED.value, literal_execute=True)
+    batch = (
+        select(Borrow.id)
+        .where(Borrow.loan_status == borrowed, Borrow.due_date < now)
+        .order_by(Borrow.due_date)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(Borrow)
+        .where(Borrow.id.in_(batch.scalar_subquery()))
+        .values(loan_status=LoanStatus.OVERDUE.value, status_changed_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def check_overdue_loans(db: Session, batch_size: int = settings.LOAN_OVERDUE_BATCH_SIZE) -> list[dict]:
+    """Mark every overdue loan, committing per batch; returns the flipped loans' columns.
+
+    Rows rather than entities, since each commit would expire the entities
+    and serializing them afterwards would reload every loan.
+    """
+    now = datetime.now(timezone.utc)
+    updated_loans = []
+
+    while True:
+        rows = db.execute(_overdue_batch_statement(now, batch_size).returning(*Borrow.__table__.c)).mappings().all()
+        db.commit()
+        updated_loans.extend(dict(row) for row in rows)
+        if len(rows) < batch_size:
+            return updated_loans
+
+
+LOAN_EXPAND_RELATIONS = {
+    "asset": "asset_id",
+    "user": "user_id",
+}
+
+
+def _loan_list_options(fields: Optional[Sequence[str]] = None, expand: Sequence[str] = ()) -> list:
+    options = []
+    if fields is not None:
+        required = ["id", "created_at", *(LOAN_EXPAND_RELATIONS[name] for name in expand)]
+        options.append(load_columns(Borrow, fields, required))
+
+    if "asset" in expand:
+        options.append(joinedload(Borrow.asset).load_only(Asset.id, Asset.asset_code, Asset.name))
+    if "user" in expand:
+        options.append(joinedload(Borrow.user).load_only(User.id, User.username, User.email))
+
+    return options
+
+
+def _loan_list_statement(
+    user_id: Optional[uuid.UUID] = None,
+    status: Optional[str] = None,
+    asset_id: Optional[uuid.UUID] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    expand: Sequence[str] = (),
+):
+    """Newest-first page plus one extra row to detect more; matches the ``(..., created_at, id)`` indexes"""
+    stmt = select(Borrow).options(*_loan_list_options(fields, expand))
+
+    if user_id:
+        stmt = stmt.where(Borrow.user_id == user_id)
+
+    if status:
+        stmt = stmt.where(Borrow.loan_status == status)
+
+    if asset_id:
+        stmt = stmt.where(Borrow.asset_id == asset_id)
+
+    if created_from:
+        stmt = stmt.where(Borrow.created_at >= created_from)
+
+    if created_to:
+        stmt = stmt.where(Borrow.created_at < created_to)
+
+    before = decode_cursor(cursor)
+    if before is not None:
+        stmt = stmt.where(tuple_(Borrow.created_at, Borrow.id) < tuple_(*before))
+
+    return stmt.order_by(Borrow.created_at.desc(), Borrow.id.desc()).limit(limit + 1)
+
+
+def _loan_page(loans: list[Borrow], limit: int) -> tuple[list[Borrow], Optional[str]]:
+    next_cursor = None
+    if len(loans) > limit:
+        loans = loans[:limit]
+        next_cursor = encode_cursor(loans[-1].created_at, loans[-1].id)
+    return loans, next_cursor
 
 
 def get_user_loans(
     db: Session,
     user_id: uuid.UUID,
     status: Optional[str] = None,
-) -> list[Borrow]:
-    query = db.query(Borrow).filter(Borrow.user_id == user_id)
-    
-    if status:
-        query = query.filter(Borrow.loan_status == status)
-    
-    return query.order_by(Borrow.created_at.desc()).all()
+    asset_id: Optional[uuid.UUID] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    expand: Sequence[str] = (),
+) -> tuple[list[Borrow], Optional[str]]:
+    stmt = _loan_list_statement(
+        user_id, status, asset_id, created_from, created_to, limit, cursor, fields, expand
+    )
+    return _loan_page(list(db.execute(stmt).scalars().all()), limit)
 
 
 def get_all_loans(
     db: Session,
     status: Optional[str] = None,
     asset_id: Optional[uuid.UUID] = None,
-) -> list[Borrow]:
-    query = db.query(Borrow)
-    
-    if status:
-        query = query.filter(Borrow.loan_status == status)
-    
-    if asset_id:
-        query = query.filter(Borrow.asset_id == asset_id)
-    
-    return query.order_by(Borrow.created_at.desc()).all()
+    user_id: Optional[uuid.UUID] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    expand: Sequence[str] = (),
+) -> tuple[list[Borrow], Optional[str]]:
+    stmt = _loan_list_statement(
+        user_id, status, asset_id, created_from, created_to, limit, cursor, fields, expand
+    )
+    return _loan_page(list(db.execute(stmt).scalars().all()), limit)
 
 
 def get_loan_by_id(
@@ -262,3 +476,85 @@ def get_loan_by_id(
         raise NotFoundException("Loan")
     return loan
 
+
+async def _get_loan_async(db: AsyncSession, loan_id: uuid.UUID) -> Borrow:
+    loan = (await db.execute(select(Borrow).where(Borrow.id == loan_id))).scalars().first()
+    if not loan:
+        raise NotFoundException("Loan")
+    return loan
+
+
+async def sweep_overdue_loans_async(
+    engine: AsyncEngine, batch_size: int = settings.LOAN_OVERDUE_BATCH_SIZE
+) -> Optional[int]:
+    """Mark every overdue loan, committing per batch.
+
+    Returns the number of loans flipped, or ``None`` when another worker
+    holds the sweep lock. The session-level advisory lock lives on this
+    connection, so a crashed worker releases it with its connection.
+    """
+    async with engine.connect() as conn:
+        if not await conn.scalar(select(func.pg_try_advisory_lock(OVERDUE_SWEEP_LOCK_KEY))):
+            await conn.rollback()
+            return None
+        await conn.commit()
+
+        try:
+            now = datetime.now(timezone.utc)
+            swept = 0
+            while True:
+                result = await conn.execute(_overdue_batch_statement(now, batch_size).returning(Borrow.id))
+                count = len(result.all())
+                await conn.commit()
+                swept += count
+                if count < batch_size:
+                    return swept
+        finally:
+            await conn.rollback()
+            await conn.scalar(select(func.pg_advisory_unlock(OVERDUE_SWEEP_LOCK_KEY)))
+            await conn.commit()
+
+
+async def get_user_loans_async(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    status: Optional[str] = None,
+    asset_id: Optional[uuid.UUID] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    expand: Sequence[str] = (),
+) -> tuple[list[Borrow], Optional[str]]:
+    stmt = _loan_list_statement(
+        user_id, status, asset_id, created_from, created_to, limit, cursor, fields, expand
+    )
+    result = await db.execute(stmt)
+    return _loan_page(list(result.scalars().all()), limit)
+
+
+async def get_all_loans_async(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    asset_id: Optional[uuid.UUID] = None,
+    user_id: Optional[uuid.UUID] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    expand: Sequence[str] = (),
+) -> tuple[list[Borrow], Optional[str]]:
+    stmt = _loan_list_statement(
+        user_id, status, asset_id, created_from, created_to, limit, cursor, fields, expand
+    )
+    result = await db.execute(stmt)
+    return _loan_page(list(result.scalars().all()), limit)
+
+
+async def get_loan_by_id_async(
+    db: AsyncSession,
+    loan_id: uuid.UUID,
+) -> Borrow:
+    return await _get_loan_async(db, loan_id)
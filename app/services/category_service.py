@@ -0,0 +1,91 @@
+import uuid
+from typing import Dict, List, Sequence
+from sqlalchemy.orm import Session
+from app.core.asset_cache import asset_cache
+from app.core.category_cache import category_cache
+from app.db.constraints import translate_integrity_errors
+from app.models.asset_category import AssetCategory
+from app.repositories.category_repo import CategoryRepository
+from app.repositories.table_version_repo import TableVersionRepository
+from app.utils.exceptions import NotFoundException, ValidationException
+
+
+class CategoryService:
+    @staticmethod
+    def create_category(db: Session, category_data: dict) -> AssetCategory:
+        if CategoryRepository.get_by_name(db, category_data["name"]):
+            raise ValidationException("Category name already exists")
+
+        with translate_integrity_errors(db):
+            category = CategoryRepository.create(db, category_data)
+        category_cache.invalidate()
+        return category
+
+    @staticmethod
+    def get_category(db: Session, category_id: uuid.UUID) -> AssetCategory:
+        category = CategoryRepository.get_by_id(db, category_id)
+        if not category:
+            raise NotFoundException("Asset Category")
+        return category
+
+    @staticmethod
+    def get_categories(db: Session, skip: int = 0, limit: int = 100) -> List[AssetCategory]:
+        return CategoryRepository.get_all(db, skip=skip, limit=limit)
+
+    @staticmethod
+    def count_categories(db: Session) -> int:
+        return CategoryRepository.count(db)
+
+    @staticmethod
+    def get_asset_counts(db: Session, category_ids: Sequence[uuid.UUID]) -> Dict[str, dict]:
+        """``{category_id: {"total", "by_status"}}``, cached until the next asset write"""
+        ids = sorted(str(category_id) for category_id in category_ids)
+        versions = TableVersionRepository.get_versions(db, ["assets"])
+
+        def load() -> Dict[str, dict]:
+            counts = CategoryRepository.count_assets_by_status(db, category_ids)
+            return {
+                str(category_id): {"total": sum(by_status.values()), "by_status": by_status}
+                for category_id, by_status in counts.items()
+            }
+
+        return asset_cache.get_list("category_counts", {"ids": ids, "versions": versions}, load)
+
+    @staticmethod
+    def get_category_names(db: Session) -> Dict[uuid.UUID, str]:
+        """Every category as ``{id: name}``, from the in-process category cache"""
+        return category_cache.get_all(lambda: CategoryRepository.get_id_names(db))
+
+    @staticmethod
+    def category_exists(db: Session, category_id: uuid.UUID) -> bool:
+        if category_id in CategoryService.get_category_names(db):
+            return True
+
+        # Possibly created by another worker since the snapshot was loaded
+        if CategoryRepository.get_by_id(db, category_id) is None:
+            return False
+        category_cache.invalidate()
+        return True
+
+    @staticmethod
+    def update_category(db: Session, category_id: uuid.UUID, update_data: dict) -> AssetCategory:
+        category = CategoryService.get_category(db, category_id)
+
+        if update_data.get("name") and update_data["name"].lower() != category.name.lower():
+            if CategoryRepository.get_by_name(db, update_data["name"]):
+                raise ValidationException("Category name already exists")
+
+        with translate_integrity_errors(db):
+            category = CategoryRepository.update(db, category, update_data)
+        category_cache.invalidate()
+        return category
+
+    @staticmethod
+    def delete_category(db: Session, category_id: uuid.UUID) -> None:
+        category = CategoryService.get_category(db, category_id)
+
+        if CategoryRepository.has_assets(db, category_id):
+            raise ValidationException("Category still has assets")
+
+        CategoryRepository.delete(db, category)
+        category_cache.invalidate()
@@ -1,30 +1,32 @@
 import uuid
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Sequence
 from sqlalchemy.orm import Session
+from app.db.constraints import translate_integrity_errors
 from app.models.user import User
-from app.models.role import Role
 from app.repositories.user_repo import UserRepository
-from app.core.security import hash_password
-from app.utils.exceptions import NotFoundException, ValidationException
+from app.core.hashing import password_hasher
+from app.core.auth_cache import principal_cache
+from app.utils.exceptions import NotFoundException
 
 
 class UserService:
     @staticmethod
     def create_user(db: Session, user_data: dict) -> User:
-        if UserRepository.get_by_username(db, user_data["username"]):
-            raise ValidationException("Username already exists")
-
-        if UserRepository.get_by_email(db, user_data["email"]):
-            raise ValidationException("Email already exists")
-
-        role = db.query(Role).filter(Role.id == user_data["role_id"]).first()
-        if not role:
-            raise NotFoundException("Role")
-
         if "password" in user_data:
-            user_data["password_hash"] = hash_password(user_data.pop("password"))
+            user_data["password_hash"] = password_hasher.hash(user_data.pop("password"))
 
-        return UserRepository.create(db, user_data)
+        # Username/email uniqueness and the role are enforced by constraints
+        with translate_integrity_errors(db):
+            return UserRepository.create(db, user_data)
+
+    @staticmethod
+    def _revokes_tokens(user: User, update_data: dict) -> bool:
+        if update_data.get("role_id") and update_data["role_id"] != user.role_id:
+            return True
+        if update_data.get("is_active") is False and user.is_active:
+            return True
+        return "password_hash" in update_data
 
     @staticmethod
     def get_user(db: Session, user_id: uuid.UUID) -> User:
@@ -33,6 +35,14 @@ class UserService:
             raise NotFoundException("User")
         return user
 
+    @staticmethod
+    def get_user_version(db: Session, user_id: uuid.UUID) -> datetime:
+        """``updated_at`` of the user, read without loading the row"""
+        updated_at = UserRepository.get_updated_at(db, user_id)
+        if updated_at is None:
+            raise NotFoundException("User")
+        return updated_at
+
     @staticmethod
     def get_users(
         db: Session,
@@ -41,9 +51,20 @@ class UserService:
         is_active: Optional[bool] = None,
         role_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
+        search_mode: str = "contains",
+        fields: Optional[Sequence[str]] = None,
+        expand: Sequence[str] = (),
     ) -> List[User]:
         return UserRepository.get_all(
-            db, skip=skip, limit=limit, is_active=is_active, role_id=role_id, search=search
+            db,
+            skip=skip,
+            limit=limit,
+            is_active=is_active,
+            role_id=role_id,
+            search=search,
+            search_mode=search_mode,
+            fields=fields,
+            expand=expand,
         )
 
     @staticmethod
@@ -52,45 +73,46 @@ class UserService:
         is_active: Optional[bool] = None,
         role_id: Optional[uuid.UUID] = None,
         search: Optional[str] = None,
+        search_mode: str = "contains",
     ) -> int:
-        return UserRepository.count(db, is_active=is_active, role_id=role_id, search=search)
+        return UserRepository.count(
+            db, is_active=is_active, role_id=role_id, search=search, search_mode=search_mode
+        )
 
     @staticmethod
     def update_user(db: Session, user_id: uuid.UUID, update_data: dict) -> User:
         user = UserService.get_user(db, user_id)
 
-        if "username" in update_data and update_data["username"]:
-            existing = UserRepository.get_by_username(db, update_data["username"])
-            if existing and existing.id != user_id:
-                raise ValidationException("Username already exists")
-
-        if "email" in update_data and update_data["email"]:
-            existing = UserRepository.get_by_email(db, update_data["email"])
-            if existing and existing.id != user_id:
-                raise ValidationException("Email already exists")
-
-        if "role_id" in update_data and update_data["role_id"]:
-            role = db.query(Role).filter(Role.id == update_data["role_id"]).first()
-            if not role:
-                raise NotFoundException("Role")
-
         if "password" in update_data:
-            update_data["password_hash"] = hash_password(update_data.pop("password"))
+            update_data["password_hash"] = password_hasher.hash(update_data.pop("password"))
+
+        if UserService._revokes_tokens(user, update_data):
+            update_data["token_version"] = User.token_version + 1
 
-        return UserRepository.update(db, user, update_data)
+        with translate_integrity_errors(db):
+            user = UserRepository.update(db, user, update_data)
+        principal_cache.invalidate_user(user_id)
+        return user
 
     @staticmethod
     def delete_user(db: Session, user_id: uuid.UUID) -> None:
         user = UserService.get_user(db, user_id)
         UserRepository.delete(db, user)
+        principal_cache.invalidate_user(user_id)
 
     @staticmethod
     def deactivate_user(db: Session, user_id: uuid.UUID) -> User:
         user = UserService.get_user(db, user_id)
-        return UserRepository.update(db, user, {"is_active": False})
+        user = UserRepository.update(
+            db, user, {"is_active": False, "token_version": User.token_version + 1}
+        )
+        principal_cache.invalidate_user(user_id)
+        return user
 
     @staticmethod
     def activate_user(db: Session, user_id: uuid.UUID) -> User:
         user = UserService.get_user(db, user_id)
-        return UserRepository.update(db, user, {"is_active": True})
+        user = UserRepository.update(db, user, {"is_active": True})
+        principal_cache.invalidate_user(user_id)
+        return user
 
@@ -1,23 +1,48 @@
+from ipaddress import ip_address
+
 from fastapi import Request
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.models.audit_log import AuditLog
 from app.models.user import User
-from typing import Optional
+from typing import Optional, Sequence
 import uuid
 
+def _is_trusted_proxy(address: Optional[str]) -> bool:
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in settings.trusted_proxy_networks)
+
+
 def get_client_ip(request: Request) -> Optional[str]:
+    """Address of the client, as used for rate limits and audit logs.
+
+    Forwarding headers are client-controlled, so they are only honoured when
+    the connection comes from one of ``TRUSTED_PROXIES``. ``X-Forwarded-For``
+    is then read from the nearest hop backwards and the first address that
+    is not a trusted proxy wins; entries further left could be forged.
+    """
+    peer = request.client.host if request.client else None
+    if not _is_trusted_proxy(peer):
+        return peer
+
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not _is_trusted_proxy(hop):
+                return hop
+        if hops:
+            return hops[0]
     
     real_ip = request.headers.get("X-Real-IP")
     if real_ip:
-        return real_ip
-    
-    if request.client:
-        return request.client.host
+        return real_ip.strip()
     
-    return None
+    return peer
 
 
 def create_audit_log(
@@ -42,6 +67,32 @@ def create_audit_log(
     
     return audit_log
 
+def create_audit_logs_bulk(
+    db: Session,
+    user: User,
+    action: str,
+    entity: str,
+    entity_ids: Sequence[uuid.UUID],
+    ip_address: Optional[str] = None,
+) -> None:
+    """Insert one audit log per entity in a single statement, inside the caller's transaction"""
+    if not entity_ids:
+        return
+
+    db.execute(
+        insert(AuditLog),
+        [
+            {
+                "user_id": user.id if user else None,
+                "action": action,
+                "entity": entity,
+                "entity_id": entity_id,
+                "ip_address": ip_address,
+            }
+            for entity_id in entity_ids
+        ],
+    )
+
 def log_asset_action(
     db: Session,
     user: User,
@@ -58,6 +109,22 @@ def log_asset_action(
         ip_address=ip_address,
     )
 
+def log_category_action(
+    db: Session,
+    user: User,
+    action: str,
+    category_id: uuid.UUID,
+    ip_address: Optional[str] = None,
+) -> AuditLog:
+    return create_audit_log(
+        db=db,
+        user=user,
+        action=action,
+        entity="category",
+        entity_id=category_id,
+        ip_address=ip_address,
+    )
+
 def log_loan_action(
     db: Session,
     user: User,
@@ -0,0 +1,41 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+# Responses depend on the caller's token, so shared caches must not reuse them;
+# no-cache makes browsers and proxies revalidate with If-None-Match every time.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the repr of ``parts``"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """``If-None-Match`` evaluation (weak comparison, as RFC 9110 requires for it)"""
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Authorization",
+    }
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    response.headers.update(cache_headers(etag))
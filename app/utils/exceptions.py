@@ -59,11 +59,34 @@ class ValidationException(BaseAPIException):
         self.errors = errors
 
 
+class TooManyRequestsException(BaseAPIException):
+    """Exception for requests rejected by admission control or rate limiting"""
+    def __init__(self, detail: str = "Too many requests", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            error_code="TOO_MANY_REQUESTS",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class ServiceUnavailableException(BaseAPIException):
+    """Exception for temporarily unavailable backing services"""
+    def __init__(self, detail: str = "Service temporarily unavailable", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            error_code="SERVICE_UNAVAILABLE",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 def create_error_response(
     status_code: int,
     detail: str,
     error_code: str = None,
     errors: Dict = None,
+    headers: Dict[str, str] = None,
 ) -> JSONResponse:
     """Create a standardized error response"""
     content = {
@@ -78,5 +101,6 @@ def create_error_response(
     return JSONResponse(
         status_code=status_code,
         content=content,
+        headers=headers,
     )
 
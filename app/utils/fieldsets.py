@@ -0,0 +1,79 @@
+from typing import Any, Iterable, Optional, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only
+
+from app.utils.exceptions import ValidationException
+from app.utils.response import validate_list
+
+
+def _split(value: Optional[str]) -> list[str]:
+    if not value:
+        return []
+    return list(dict.fromkeys(part.strip() for part in value.split(",") if part.strip()))
+
+
+def parse_fields(value: Optional[str], schema: type[BaseModel]) -> Optional[list[str]]:
+    """Parse ``?fields=a,b`` against ``schema``; None means every field"""
+    fields = _split(value)
+    if not fields:
+        return None
+
+    unknown = [field for field in fields if field not in schema.model_fields]
+    if unknown:
+        raise ValidationException(f"Unknown field(s): {', '.join(unknown)}")
+    return fields
+
+
+def parse_expand(value: Optional[str], allowed: Iterable[str]) -> list[str]:
+    """Parse ``?expand=a,b`` against the relations an endpoint can embed"""
+    expand = _split(value)
+    unknown = [name for name in expand if name not in allowed]
+    if unknown:
+        raise ValidationException(f"Unknown expand value(s): {', '.join(unknown)}")
+    return expand
+
+
+def load_columns(model: Any, fields: Sequence[str], required: Sequence[str] = ()):
+    """``load_only`` option restricted to ``required`` plus the requested ``fields``"""
+    names = dict.fromkeys([*required, *fields])
+    return load_only(*(getattr(model, name) for name in names))
+
+
+def project(
+    obj: Any,
+    schema: type[BaseModel],
+    fields: Optional[Sequence[str]] = None,
+    expand: Optional[dict[str, type[BaseModel]]] = None,
+) -> dict:
+    """Serialize ``obj`` with only ``fields`` (all of ``schema`` when None) plus expanded relations.
+
+    Sparse output reads the attributes directly instead of validating the
+    whole schema, so columns that were not loaded are never touched.
+    """
+    if fields is None:
+        data = schema.model_validate(obj).model_dump()
+    else:
+        data = {field: getattr(obj, field) for field in fields}
+
+    for name, summary in (expand or {}).items():
+        related = getattr(obj, name)
+        data[name] = summary.model_validate(related).model_dump() if related is not None else None
+
+    return data
+
+
+def project_many(
+    objects: Sequence[Any],
+    schema: type[BaseModel],
+    fields: Optional[Sequence[str]] = None,
+    expand: Optional[dict[str, type[BaseModel]]] = None,
+) -> list:
+    """``project`` over a page; full rows are validated in one call and kept as models.
+
+    The result is meant for ``FastJSONResponse`` (or the asset cache), which
+    encode models directly.
+    """
+    if fields is None and not expand:
+        return validate_list(schema, objects)
+    return [project(obj, schema, fields, expand) for obj in objects]
@@ -1,5 +1,31 @@
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core in a single pass.
+
+    Pydantic models, UUIDs and datetimes are written directly, so routes
+    returning it skip ``model_dump()``, FastAPI's ``jsonable_encoder`` walk
+    and the stdlib ``json`` encoder. Return it from the route itself;
+    headers set on an injected ``Response`` are not copied onto it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def validate_list(schema: type[BaseModel], objects: Any) -> list:
+    """Validate ORM objects into ``schema`` instances in one call, for ``FastJSONResponse``"""
+    return list_adapter(schema).validate_python(objects, from_attributes=True)
 
 
 def create_success_response(
@@ -29,3 +55,16 @@ def success_response(
         "message": message,
         "data": data,
     }
+
+
+def fast_success_response(
+    data: Any = None,
+    message: str = "Success",
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status_code,
+        content=success_response(data=data, message=message, status_code=status_code),
+        headers=headers,
+    )
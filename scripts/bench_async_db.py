@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Sync vs async database path benchmark
+Runs the same I/O-bound query (SELECT pg_sleep) at increasing concurrency,
+once through sync sessions on a 40-thread pool (Starlette's default
+threadpool size) and once through AsyncSession on the event loop.
+
+Usage:
+    python scripts/bench_async_db.py --concurrency 10 40 200 --requests 400
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.session import get_async_database_url
+
+STARLETTE_THREADS = 40
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run_sync(concurrency, requests, sleep):
+    engine = create_engine(settings.DATABASE_URL, pool_size=concurrency, max_overflow=0)
+    latencies = []
+
+    def one_request(_):
+        start = time.perf_counter()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT pg_sleep(:s)"), {"s": sleep})
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(concurrency, STARLETTE_THREADS)) as pool:
+        list(pool.map(one_request, range(requests)))
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    return elapsed, latencies
+
+
+async def run_async(concurrency, requests, sleep):
+    engine = create_async_engine(get_async_database_url(), pool_size=concurrency, max_overflow=0)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one_request():
+        async with semaphore:
+            start = time.perf_counter()
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT pg_sleep(:s)"), {"s": sleep})
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed, latencies
+
+
+def report(mode, concurrency, requests, elapsed, latencies):
+    print(
+        f"{mode:<6} c={concurrency:<5} "
+        f"throughput={requests / elapsed:8.1f} req/s  "
+        f"p50={statistics.median(latencies) * 1000:7.1f} ms  "
+        f"p99={percentile(latencies, 99) * 1000:7.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 40, 100, 200])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--sleep", type=float, default=0.02, help="Simulated query time in seconds")
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        report("sync", concurrency, args.requests, *run_sync(concurrency, args.requests, args.sleep))
+        report("async", concurrency, args.requests, *asyncio.run(run_async(concurrency, args.requests, args.sleep)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+JSON response serialization benchmark
+Serializes a page of asset rows the old way (model_validate().model_dump()
+per row, then FastAPI's jsonable_encoder and JSONResponse's json.dumps) and
+through FastJSONResponse (one TypeAdapter validation for the page, encoded
+by pydantic-core). No database or server is needed; rows are plain objects
+with the same attributes as the ORM model.
+
+Usage:
+    python scripts/bench_json_response.py --rows 100 --iterations 2000
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.schemas.asset import AssetResponse
+from app.utils.response import fast_success_response, success_response, validate_list
+
+
+def make_rows(count):
+    now = datetime.now(timezone.utc)
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            asset_code=f"AST-{i:06d}",
+            name=f"Laptop Dell Latitude 54{i % 100:02d}",
+            serial_number=f"SN-{uuid.uuid4().hex[:12].upper()}",
+            category_id=uuid.uuid4(),
+            current_status="active",
+            asset_condition="good",
+            description="Standard issue laptop for the engineering team",
+            pic_user_id=uuid.uuid4() if i % 2 else None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def before(rows):
+    items = [AssetResponse.model_validate(row).model_dump() for row in rows]
+    content = success_response(data={"items": items, "total": len(rows)}, message="Assets retrieved successfully")
+    return JSONResponse(content=jsonable_encoder(content)).body
+
+
+def after(rows):
+    items = validate_list(AssetResponse, rows)
+    return fast_success_response(data={"items": items, "total": len(rows)}, message="Assets retrieved successfully").body
+
+
+def measure(fn, rows, iterations):
+    fn(rows)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(rows)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    results = {"before": measure(before, rows, args.iterations), "after": measure(after, rows, args.iterations)}
+
+    for label, seconds in results.items():
+        print(
+            f"{label:<7} page={seconds * 1000:8.3f} ms  "
+            f"per row={seconds / args.rows * 1_000_000:7.2f} us"
+        )
+    print(f"speedup: {results['before'] / results['after']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Concurrent borrowing stress test
+Creates a throwaway asset with one approved loan per client, then has every
+client call start_borrowing on the same asset at the same moment. Exactly
+one client may win; the script fails if the asset ends up with more than
+one active loan, and reports attempt throughput and latency. Each round
+uses a fresh asset and cleans up after itself.
+
+Usage:
+    python scripts/bench_loan_race.py --email superadmin@example.com --clients 200 --rounds 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.models import Asset, AssetCategory, Borrow, User
+from app.models.enums import LoanStatus
+from app.services.borrow_service import start_borrowing
+from app.utils.exceptions import BaseAPIException
+
+ACTIVE_STATUSES = (LoanStatus.BORROWED.value, LoanStatus.OVERDUE.value)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def setup_round(Session, user_id, category_id, clients):
+    asset_id = uuid.uuid4()
+    with Session() as db:
+        db.add(Asset(
+            id=asset_id,
+            asset_code=f"RACE-{asset_id.hex[:12].upper()}",
+            name="Loan race benchmark asset",
+            serial_number=f"RACE-SN-{asset_id.hex.upper()}",
+            category_id=category_id,
+            current_status="available",
+            asset_condition="good",
+        ))
+        db.flush()
+        loans = [
+            Borrow(asset_id=asset_id, user_id=user_id, loan_status=LoanStatus.APPROVED.value)
+            for _ in range(clients)
+        ]
+        db.add_all(loans)
+        db.commit()
+        return asset_id, [loan.id for loan in loans]
+
+
+def cleanup_round(Session, asset_id):
+    with Session() as db:
+        db.execute(delete(Borrow).where(Borrow.asset_id == asset_id))
+        db.execute(delete(Asset).where(Asset.id == asset_id))
+        db.commit()
+
+
+def run_round(Session, user_id, loan_ids):
+    barrier = threading.Barrier(len(loan_ids))
+    latencies = []
+    outcomes = {"won": 0, "rejected": 0, "error": 0}
+    lock = threading.Lock()
+
+    def attempt(loan_id):
+        barrier.wait()
+        start = time.perf_counter()
+        outcome = "won"
+        with Session() as db:
+            try:
+                start_borrowing(db, loan_id, user_id)
+            except BaseAPIException:
+                outcome = "rejected"
+            except Exception:
+                outcome = "error"
+        with lock:
+            latencies.append(time.perf_counter() - start)
+            outcomes[outcome] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(loan_ids)) as pool:
+        list(pool.map(attempt, loan_ids))
+    return time.perf_counter() - start, latencies, outcomes
+
+
+def verify(Session, asset_id):
+    with Session() as db:
+        active = db.scalar(
+            select(func.count()).select_from(Borrow).where(
+                Borrow.asset_id == asset_id, Borrow.loan_status.in_(ACTIVE_STATUSES)
+            )
+        )
+        asset_status = db.scalar(select(Asset.current_status).where(Asset.id == asset_id))
+    return active, asset_status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--email", default="superadmin@example.com", help="Existing user that owns the bench loans")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pool-size", type=int, default=50, help="Must stay below the server's max_connections")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL, pool_size=args.pool_size, max_overflow=0, pool_timeout=120)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    with Session() as db:
+        user_id = db.scalar(select(User.id).where(User.email == args.email))
+        category_id = db.scalar(select(AssetCategory.id).limit(1))
+    if user_id is None or category_id is None:
+        sys.exit("Need an existing user (--email) and at least one asset category; run scripts/seed_db.py first")
+
+    failures = 0
+    for round_number in range(1, args.rounds + 1):
+        asset_id, loan_ids = setup_round(Session, user_id, category_id, args.clients)
+        try:
+            elapsed, latencies, outcomes = run_round(Session, user_id, loan_ids)
+            active, asset_status = verify(Session, asset_id)
+        finally:
+            cleanup_round(Session, asset_id)
+
+        ok = outcomes["won"] == 1 and active == 1 and asset_status == "borrowed"
+        failures += not ok
+        print(
+            f"round {round_number:<3} clients={args.clients:<5} "
+            f"won={outcomes['won']:<3} rejected={outcomes['rejected']:<5} errors={outcomes['error']:<3} "
+            f"active_loans={active:<3} "
+            f"throughput={args.clients / elapsed:8.1f} attempts/s  "
+            f"p50={statistics.median(latencies) * 1000:7.1f} ms  "
+            f"p99={percentile(latencies, 99) * 1000:7.1f} ms  "
+            f"{'OK' if ok else 'DOUBLE-BOOKED' if active > 1 else 'FAILED'}"
+        )
+
+    engine.dispose()
+    if failures:
+        sys.exit(f"{failures} of {args.rounds} rounds failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Login storm benchmark
+Measures /api/v1/assets/list_assets latency while a burst of logins runs
+against the same server, once without and once with the storm.
+
+Usage:
+    uvicorn app.main:app --port 8000 &
+    python scripts/bench_login_storm.py --base-url http://localhost:8000 \
+        --email superadmin@example.com --password admin123
+"""
+import argparse
+import statistics
+import threading
+import time
+
+import requests
+
+
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def login(base_url, email, password):
+    response = requests.post(
+        f"{base_url}/api/v1/auth/login",
+        json={"email": email, "password": password},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()["data"]["access_token"]
+
+
+def reader(base_url, token, stop, latencies):
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    while not stop.is_set():
+        start = time.perf_counter()
+        session.get(f"{base_url}/api/v1/assets/list_assets", params={"limit": 20}, timeout=60)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+def stormer(base_url, email, password, stop, outcomes):
+    session = requests.Session()
+    while not stop.is_set():
+        response = session.post(
+            f"{base_url}/api/v1/auth/login",
+            json={"email": email, "password": password},
+            timeout=60,
+        )
+        outcomes.append(response.status_code)
+
+
+def run_phase(args, token, storm):
+    stop = threading.Event()
+    latencies = []
+    outcomes = []
+    threads = [
+        threading.Thread(target=reader, args=(args.base_url, token, stop, latencies))
+        for _ in range(args.readers)
+    ]
+    if storm:
+        threads += [
+            threading.Thread(target=stormer, args=(args.base_url, args.email, args.password, stop, outcomes))
+            for _ in range(args.logins)
+        ]
+
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return latencies, outcomes
+
+
+def report(label, latencies, outcomes):
+    print(f"\n{label}")
+    print(f"  list_assets requests: {len(latencies)}")
+    if latencies:
+        print(f"  p50: {statistics.median(latencies):8.1f} ms")
+        print(f"  p95: {percentile(latencies, 95):8.1f} ms")
+        print(f"  p99: {percentile(latencies, 99):8.1f} ms")
+    if outcomes:
+        by_status = {}
+        for status_code in outcomes:
+            by_status[status_code] = by_status.get(status_code, 0) + 1
+        print(f"  login responses: {dict(sorted(by_status.items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", default="superadmin@example.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0)
+    args = parser.parse_args()
+
+    token = login(args.base_url, args.email, args.password)
+
+    report("Baseline (no login storm)", *run_phase(args, token, storm=False))
+    report(f"During login storm ({args.logins} concurrent clients)", *run_phase(args, token, storm=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Rate limiter micro-benchmark
+Measures the cost of a single limit check for the in-memory backend and,
+when --redis-url is given, for the Redis backend.
+
+Usage:
+    python scripts/bench_rate_limit.py --iterations 200000
+    python scripts/bench_rate_limit.py --redis-url redis://localhost:6379/0
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.rate_limit import InMemoryRateLimitBackend, RateLimitRule, RedisRateLimitBackend
+
+
+def measure(backend, iterations, identities):
+    rule = RateLimitRule.parse("1000000/second")
+    keys = [f"bench:{i}" for i in range(identities)]
+    start = time.perf_counter()
+    for i in range(iterations):
+        backend.hit(keys[i % identities], rule)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--identities", type=int, default=1000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    per_check = measure(InMemoryRateLimitBackend(), args.iterations, args.identities)
+    print(f"memory backend: {per_check:.2f} us/check")
+
+    if args.redis_url:
+        backend = RedisRateLimitBackend(args.redis_url, prefix="ratelimit-bench:")
+        per_check = measure(backend, min(args.iterations, 20000), args.identities)
+        backend.reset()
+        print(f"redis backend:  {per_check:.2f} us/check")
+
+
+if __name__ == "__main__":
+    main()
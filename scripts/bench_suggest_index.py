@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Asset suggest index benchmark
+Builds the in-memory prefix index over synthetic asset codes and serial
+numbers, then reports build time, memory used and per-lookup latency.
+
+Usage:
+    python scripts/bench_suggest_index.py --assets 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.suggest_index import AssetSuggestIndex
+
+PREFIXES = ["LAP", "PRJ", "SWT", "SRV", "MON"]
+
+
+def synthetic_rows(count):
+    for i in range(count):
+        yield f"{PREFIXES[i % len(PREFIXES)]}-{i:07d}", f"SN{i * 7919 % 100000000:08d}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    index = AssetSuggestIndex(max_entries=args.assets * 2 + 1)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    index.begin_rebuild()
+    index.finish_rebuild(synthetic_rows(args.assets))
+    build_seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"entries:      {len(index)}")
+    print(f"build time:   {build_seconds:.2f} s")
+    print(f"memory:       {current / 1024 / 1024:.1f} MB ({current / len(index):.0f} bytes/entry)")
+
+    rng = random.Random(42)
+    prefixes = []
+    for _ in range(args.lookups):
+        code = f"{rng.choice(PREFIXES)}-{rng.randrange(args.assets):07d}"
+        prefixes.append(code[: rng.randint(3, len(code))])
+
+    timings = []
+    for prefix in prefixes:
+        start = time.perf_counter_ns()
+        index.suggest(prefix, args.limit)
+        timings.append((time.perf_counter_ns() - start) / 1000)
+
+    timings.sort()
+    print(f"lookup p50:   {statistics.median(timings):.1f} us")
+    print(f"lookup p99:   {timings[int(len(timings) * 0.99)]:.1f} us")
+
+    start = time.perf_counter_ns()
+    index.add("asset_code", "LAP-9999999X")
+    index.remove("asset_code", "LAP-9999999X")
+    print(f"insert+remove: {(time.perf_counter_ns() - start) / 1000:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
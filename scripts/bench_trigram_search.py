@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Trigram search benchmark
+Loads synthetic assets into a scratch table shaped like `assets`, then times
+the search query used by list_assets (page + count) before and after adding
+the pg_trgm GIN indexes.
+
+Usage:
+    python scripts/bench_trigram_search.py --rows 1000000 --terms LAP-00042 "dell lat" SN7781
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+
+TABLE = "bench_assets_search"
+COLUMNS = ("name", "asset_code", "serial_number")
+
+LIST_SQL = f"""
+    SELECT id FROM {TABLE}
+    WHERE name ILIKE :pattern OR asset_code ILIKE :pattern OR serial_number ILIKE :pattern
+    ORDER BY created_at, id
+    LIMIT 20
+"""
+COUNT_SQL = f"""
+    SELECT count(*) FROM {TABLE}
+    WHERE name ILIKE :pattern OR asset_code ILIKE :pattern OR serial_number ILIKE :pattern
+"""
+
+
+def load(connection, rows):
+    connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    connection.execute(text(f"""
+        CREATE TABLE {TABLE} (
+            id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+            asset_code varchar(100) NOT NULL,
+            name varchar(150) NOT NULL,
+            serial_number varchar(150),
+            created_at timestamptz NOT NULL
+        )
+    """))
+    connection.execute(text(f"""
+        INSERT INTO {TABLE} (asset_code, name, serial_number, created_at)
+        SELECT
+            'LAP-' || lpad(i::text, 7, '0'),
+            (ARRAY['Dell Latitude', 'Lenovo ThinkPad', 'HP EliteBook', 'Epson Projector', 'Cisco Switch'])[1 + i % 5]
+                || ' ' || md5(i::text),
+            'SN' || (i * 7919 % 100000000)::text,
+            now() - (i || ' seconds')::interval
+        FROM generate_series(1, :rows) AS i
+    """), {"rows": rows})
+    connection.execute(text(f"CREATE INDEX ON {TABLE} (created_at, id)"))
+    connection.execute(text(f"ANALYZE {TABLE}"))
+
+
+def add_trigram_indexes(connection):
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for column in COLUMNS:
+        connection.execute(text(f"CREATE INDEX ON {TABLE} USING gin ({column} gin_trgm_ops)"))
+    connection.execute(text(f"ANALYZE {TABLE}"))
+
+
+def time_query(connection, sql, pattern, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        connection.execute(text(sql), {"pattern": pattern}).all()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run_phase(connection, label, terms, repeat):
+    print(f"\n{label}")
+    for term in terms:
+        pattern = f"%{term}%"
+        list_ms = time_query(connection, LIST_SQL, pattern, repeat)
+        count_ms = time_query(connection, COUNT_SQL, pattern, repeat)
+        print(f"  {term!r:<16} list={list_ms:9.1f} ms  count={count_ms:9.1f} ms  total={list_ms + count_ms:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--terms", nargs="+", default=["LAP-00042", "thinkpad", "SN7781", "a1b2"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch table afterwards")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+
+        print(f"Loading {args.rows} synthetic assets into {TABLE} ...")
+        load(connection, args.rows)
+
+        run_phase(connection, "Without trigram indexes (sequential scan)", args.terms, args.repeat)
+        add_trigram_indexes(connection)
+        run_phase(connection, "With pg_trgm GIN indexes", args.terms, args.repeat)
+
+        if not args.keep:
+            connection.execute(text(f"DROP TABLE {TABLE}"))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()